@@ -8,11 +8,13 @@ gyroscope, and roll/pitch (true vs accel vs EKF).
 
 from __future__ import annotations
 
+import math
 from typing import Dict, Any
 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import animation
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 
 def _cube_vertices(size: float = 0.5) -> np.ndarray:
@@ -55,17 +57,88 @@ def _rotation_matrix_xyz(roll: float, pitch: float, yaw: float) -> np.ndarray:
     as used in the simulator's accelerometer model.
     """
 
+    cr, sr = math.cos(roll), math.sin(roll)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+
+    # Closed form of Rx @ Ry @ Rz, filled one entry at a time
+    R = np.empty((3, 3))
+    R[0, 0] = cp * cy
+    R[0, 1] = -cp * sy
+    R[0, 2] = sp
+    R[1, 0] = cr * sy + sr * sp * cy
+    R[1, 1] = cr * cy - sr * sp * sy
+    R[1, 2] = -sr * cp
+    R[2, 0] = sr * sy - cr * sp * cy
+    R[2, 1] = sr * cy + cr * sp * sy
+    R[2, 2] = cr * cp
+    return R
+
+
+def _rotation_matrix_xyz_batch(
+    roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray
+) -> np.ndarray:
+    """Vectorized `_rotation_matrix_xyz` over (N,) angle arrays.
+
+    Returns an (N, 3, 3) stack so the animation can look up each
+    frame's rotation instead of rebuilding it inside the callback.
+    """
+
+    roll = np.asarray(roll, dtype=float)
+    pitch = np.asarray(pitch, dtype=float)
+    yaw = np.asarray(yaw, dtype=float)
+    n = roll.shape[0]
+
     cr, sr = np.cos(roll), np.sin(roll)
     cp, sp = np.cos(pitch), np.sin(pitch)
     cy, sy = np.cos(yaw), np.sin(yaw)
 
-    Rx = np.array([[1.0, 0.0, 0.0], [0.0, cr, -sr], [0.0, sr, cr]])
-    Ry = np.array([[cp, 0.0, sp], [0.0, 1.0, 0.0], [-sp, 0.0, cp]])
-    Rz = np.array([[cy, -sy, 0.0], [sy, cy, 0.0], [0.0, 0.0, 1.0]])
+    Rx = np.zeros((n, 3, 3))
+    Rx[:, 0, 0] = 1.0
+    Rx[:, 1, 1], Rx[:, 1, 2] = cr, -sr
+    Rx[:, 2, 1], Rx[:, 2, 2] = sr, cr
+
+    Ry = np.zeros((n, 3, 3))
+    Ry[:, 0, 0], Ry[:, 0, 2] = cp, sp
+    Ry[:, 1, 1] = 1.0
+    Ry[:, 2, 0], Ry[:, 2, 2] = -sp, cp
+
+    Rz = np.zeros((n, 3, 3))
+    Rz[:, 0, 0], Rz[:, 0, 1] = cy, -sy
+    Rz[:, 1, 0], Rz[:, 1, 1] = sy, cy
+    Rz[:, 2, 2] = 1.0
 
     return Rx @ Ry @ Rz
 
 
+def _arrow_segments(vec: np.ndarray, out: np.ndarray,
+                    length_ratio: float = 0.3) -> np.ndarray:
+    """Fill out (3, 2, 3) with an origin-to-vec arrow: shaft plus two head strokes.
+
+    Matches the geometry of `Axes3D.quiver` (15 degree head, rotated
+    about the horizontal normal of the shaft).
+    """
+
+    x, y, z = vec
+    norm = math.hypot(x, y)
+    kx, ky = (y / norm, -x / norm) if norm > 0 else (0.0, 1.0)
+    c, s = math.cos(math.radians(15)), math.sin(math.radians(15))
+
+    out[:, 0, :] = vec
+    out[0, 0, :] = 0.0
+    out[0, 1, :] = vec
+    for seg, sn in ((out[1], s), (out[2], -s)):
+        # Rodrigues rotation of vec about (kx, ky, 0) by +/-15 degrees
+        kv = kx * x + ky * y
+        rx = x * c + ky * z * sn + kx * kv * (1 - c)
+        ry = y * c - kx * z * sn + ky * kv * (1 - c)
+        rz = z * c + (kx * y - ky * x) * sn
+        seg[1, 0] = x - length_ratio * rx
+        seg[1, 1] = y - length_ratio * ry
+        seg[1, 2] = z - length_ratio * rz
+    return out
+
+
 def animate_simulation(
     result: Dict[str, Any],
     title: str = "",
@@ -87,7 +160,9 @@ def animate_simulation(
     matplotlib.animation.FuncAnimation
     """
 
-    t = result["t"]
+    t = np.ascontiguousarray(result["t"], dtype=np.float64)
+    # Python floats for the per-frame cursor updates
+    t_floats = t.tolist()
     roll_true = result["roll_true"]
     pitch_true = result["pitch_true"]
     yaw_true = result.get("yaw_true", np.zeros_like(roll_true))
@@ -102,7 +177,13 @@ def animate_simulation(
     accel = result.get("accel", None)  # shape (N,3)
     gyro = result.get("gyro", None)    # shape (N,3)
 
-    rad2deg = np.rad2deg
+    # Degree-space copies for the angle plots
+    roll_true_deg = np.rad2deg(roll_true)
+    roll_meas_acc_deg = np.rad2deg(roll_meas_acc)
+    roll_est_deg = np.rad2deg(roll_est)
+    pitch_true_deg = np.rad2deg(pitch_true)
+    pitch_meas_acc_deg = np.rad2deg(pitch_meas_acc)
+    pitch_est_deg = np.rad2deg(pitch_est)
 
     # Prepare figure: 3D cube + angle + accel + gyro subplots
     fig = plt.figure(figsize=(12, 10))
@@ -117,16 +198,11 @@ def animate_simulation(
     verts0 = _cube_vertices(size=1.0)
     edges = _cube_edges()
 
-    # Initialize 3D cube lines
-    cube_lines = []
-    for (i, j) in edges:
-        (line,) = ax3d.plot(
-            [verts0[i, 0], verts0[j, 0]],
-            [verts0[i, 1], verts0[j, 1]],
-            [verts0[i, 2], verts0[j, 2]],
-            color="C0",
-        )
-        cube_lines.append(line)
+    edge_idx = np.array(edges)  # (12, 2)
+
+    # Initialize 3D cube edges as a single collection
+    cube_lines = Line3DCollection(verts0[edge_idx], colors="C0", animated=True)
+    ax3d.add_collection3d(cube_lines)
 
     # 3D axis settings
     ax3d.set_xlabel("X")
@@ -141,15 +217,15 @@ def animate_simulation(
     ax3d.set_zlim(-lim, lim)
 
     # Angle plots (deg)
-    ax_roll.plot(t, rad2deg(roll_true), label="roll true", color="C0")
-    ax_roll.plot(t, rad2deg(roll_meas_acc), "--", label="roll accel", color="C1")
-    ax_roll.plot(t, rad2deg(roll_est), ":", label="roll EKF", color="C2")
+    ax_roll.plot(t, roll_true_deg, label="roll true", color="C0")
+    ax_roll.plot(t, roll_meas_acc_deg, "--", label="roll accel", color="C1")
+    ax_roll.plot(t, roll_est_deg, ":", label="roll EKF", color="C2")
     ax_roll.set_ylabel("Roll [deg]")
     ax_roll.legend(loc="upper right")
 
-    ax_pitch.plot(t, rad2deg(pitch_true), label="pitch true", color="C0")
-    ax_pitch.plot(t, rad2deg(pitch_meas_acc), "--", label="pitch accel", color="C1")
-    ax_pitch.plot(t, rad2deg(pitch_est), ":", label="pitch EKF", color="C2")
+    ax_pitch.plot(t, pitch_true_deg, label="pitch true", color="C0")
+    ax_pitch.plot(t, pitch_meas_acc_deg, "--", label="pitch accel", color="C1")
+    ax_pitch.plot(t, pitch_est_deg, ":", label="pitch EKF", color="C2")
     ax_pitch.set_ylabel("Pitch [deg]")
     ax_pitch.legend(loc="upper right")
 
@@ -177,9 +253,15 @@ def animate_simulation(
     ax_accel.set_xlabel("Time [s]")
 
     # Time cursor lines on plots
-    (roll_cursor,) = ax_roll.plot([t[0], t[0]], ax_roll.get_ylim(), "k-", alpha=0.3)
-    (pitch_cursor,) = ax_pitch.plot([t[0], t[0]], ax_pitch.get_ylim(), "k-", alpha=0.3)
-    (accel_cursor,) = ax_accel.plot([t[0], t[0]], ax_accel.get_ylim(), "k-", alpha=0.3)
+    (roll_cursor,) = ax_roll.plot(
+        [t[0], t[0]], ax_roll.get_ylim(), "k-", alpha=0.3, animated=True
+    )
+    (pitch_cursor,) = ax_pitch.plot(
+        [t[0], t[0]], ax_pitch.get_ylim(), "k-", alpha=0.3, animated=True
+    )
+    (accel_cursor,) = ax_accel.plot(
+        [t[0], t[0]], ax_accel.get_ylim(), "k-", alpha=0.3, animated=True
+    )
 
     fig.suptitle(title)
 
@@ -197,57 +279,57 @@ def animate_simulation(
             color="C3",
             length=0.0,
             normalize=False,
+            animated=True,
         )
 
-    def update(frame: int) -> list:
-        # Current orientation
-        roll = roll_true[frame]
-        pitch = pitch_true[frame]
-        yaw = yaw_true[frame]
+    # Rotation matrices for every frame, consistent with simulator
+    R_all = _rotation_matrix_xyz_batch(roll_true, pitch_true, yaw_true)
 
-        # Rotation matrix consistent with simulator
-        R = _rotation_matrix_xyz(roll, pitch, yaw)
+    # Rotated cube vertices for every frame, shape (N, 8, 3)
+    verts_all = np.einsum("nij,kj->nki", R_all, verts0)
 
-        # Rotate cube vertices
-        verts = (R @ verts0.T).T
+    # Edge segments, shape (12, 2, 3), refilled in place every frame
+    seg_buf = np.empty((len(edges), 2, 3))
+    # Accel arrow shaft + head segments, refilled in place every frame
+    arrow_buf = np.empty((3, 2, 3))
 
+    def update(frame: int) -> list:
         # Update cube edges
-        for line, (i, j) in zip(cube_lines, edges):
-            line.set_data([verts[i, 0], verts[j, 0]], [verts[i, 1], verts[j, 1]])
-            line.set_3d_properties([verts[i, 2], verts[j, 2]])
+        verts = verts_all[frame]
+        np.take(verts, edge_idx[:, 0], axis=0, out=seg_buf[:, 0, :])
+        np.take(verts, edge_idx[:, 1], axis=0, out=seg_buf[:, 1, :])
+        cube_lines.set_segments(seg_buf)
+        # blitting draws the artist directly, skipping Axes3D.draw's projection
+        cube_lines.do_3d_projection()
 
         # Update accel arrow in body frame (if available)
         artists = []
-        if accel is not None and accel_arrow is not None:
-            ax3d.collections.remove(accel_arrow)
+        if accel_arrow is not None:
             vec = accel[frame]
             # Scale for display
             scale = 0.05
-            accel_arrow = ax3d.quiver(
-                0.0,
-                0.0,
-                0.0,
-                vec[0] * scale,
-                vec[1] * scale,
-                vec[2] * scale,
-                color="C3",
-            )
+            accel_arrow.set_segments(_arrow_segments(vec * scale, arrow_buf))
+            accel_arrow.do_3d_projection()
             artists.append(accel_arrow)
 
         # Update time cursors
-        x = t[frame]
+        x = t_floats[frame]
         roll_cursor.set_xdata([x, x])
         pitch_cursor.set_xdata([x, x])
         accel_cursor.set_xdata([x, x])
 
-        return cube_lines + [roll_cursor, pitch_cursor, accel_cursor] + artists
+        return [cube_lines, roll_cursor, pitch_cursor, accel_cursor] + artists
+
+    # Frame interval from the (uniform) sample period
+    dt = t_floats[1] - t_floats[0] if len(t_floats) > 1 else 0.0
+    interval_ms = max(1, int(1000 * dt / max(speed, 1e-3)))
 
     anim = animation.FuncAnimation(
         fig,
         update,
-        frames=len(t),
-        interval=max(1, int(1000 * (t[1] - t[0]) / max(speed, 1e-3))),
-        blit=False,
+        frames=len(t_floats),
+        interval=interval_ms,
+        blit=True,
     )
 
     return anim
@@ -0,0 +1,113 @@
+"""Per-frame geometry for the robot-arm 3-D view.
+
+All angles are in radians. The kernels write into caller-owned buffers so
+the view can hand the same arrays to its artists every frame; they are
+compiled with numba when it is installed.
+"""
+
+from __future__ import annotations
+
+import math
+
+from numba_compat import njit
+
+
+ALPHA_ARC_R = 0.22      # radius of the α arc in the XY plane
+BETA_ARC_R = 0.28       # radius of the β arc in the arm's vertical plane
+GAMMA_TICK_LEN = 0.10   # length of the γ indicator tick
+
+
+@njit(cache=True)
+def arm_pose(a, b, g, length, end, R):
+    """Arm end point (3,) and end-effector rotation R (3, 3), in place.
+
+    R's columns are the γ-rotated cross axes and the arm direction.
+    """
+    sa, ca = math.sin(a), math.cos(a)
+    sb, cb = math.sin(b), math.cos(b)
+    sg, cg = math.sin(g), math.cos(g)
+    dx, dy, dz = sb*ca, sb*sa, cb                 # unit arm direction
+
+    # p1 = normalize(dir × ref), p2 = dir × p1, written out per component
+    if abs(dz) < 0.95:                            # ref = Z
+        n = math.hypot(dx, dy)
+        p1x, p1y, p1z = dy/n, -dx/n, 0.0
+    else:                                         # ref = X
+        n = math.hypot(dy, dz)
+        p1x, p1y, p1z = 0.0, dz/n, -dy/n
+    p2x = dy*p1z - dz*p1y
+    p2y = dz*p1x - dx*p1z
+    p2z = dx*p1y - dy*p1x
+
+    # rotate (p1, p2) about the arm axis by γ
+    R[0, 0] = cg*p1x + sg*p2x
+    R[1, 0] = cg*p1y + sg*p2y
+    R[2, 0] = cg*p1z + sg*p2z
+    R[0, 1] = -sg*p1x + cg*p2x
+    R[1, 1] = -sg*p1y + cg*p2y
+    R[2, 1] = -sg*p1z + cg*p2z
+    R[0, 2] = dx
+    R[1, 2] = dy
+    R[2, 2] = dz
+    end[0] = length*dx
+    end[1] = length*dy
+    end[2] = length*dz
+
+
+@njit(cache=True)
+def compute_arm_lines(a, b, g, length, t_unit, end, R, link, arc_a, arc_b, tick):
+    """Fill the arm pose and the line-item buffers of the arm view.
+
+    t_unit (n,)           arc parameter in [0, 1]
+    end (3,), R (3, 3)    arm pose, as from `arm_pose`
+    link (3, 2)           arm link x/y/z rows; column 0 is the origin
+    arc_a, arc_b (3, n)   α and β arc x/y/z rows
+    tick (3, 2)           γ tick x/y/z rows
+    """
+    arm_pose(a, b, g, length, end, R)
+
+    for k in range(3):
+        link[k, 0] = 0.0
+        link[k, 1] = end[k]
+        tick[k, 0] = end[k]
+        tick[k, 1] = end[k] + GAMMA_TICK_LEN*R[k, 0]
+
+    sa, ca = math.sin(a), math.cos(a)
+    for i in range(t_unit.shape[0]):
+        ta = t_unit[i]*a
+        arc_a[0, i] = ALPHA_ARC_R*math.cos(ta)
+        arc_a[1, i] = ALPHA_ARC_R*math.sin(ta)
+        arc_a[2, i] = 0.0
+        tb = t_unit[i]*b
+        s = BETA_ARC_R*math.sin(tb)
+        arc_b[0, i] = s*ca
+        arc_b[1, i] = s*sa
+        arc_b[2, i] = BETA_ARC_R*math.cos(tb)
+
+
+@njit(cache=True)
+def compute_cube_faces(cube_pts, cube_faces, end, R, faces):
+    """Place the end-effector cube for pose (end, R).
+
+    cube_pts (8, 3)       cube corners in the end-effector frame
+    cube_faces (6, 4)     corner indices per face
+    faces (6, 4, 3)       cube face vertices
+    """
+    for f in range(cube_faces.shape[0]):
+        for v in range(cube_faces.shape[1]):
+            p = cube_pts[cube_faces[f, v]]
+            for k in range(3):
+                faces[f, v, k] = (R[k, 0]*p[0] + R[k, 1]*p[1] + R[k, 2]*p[2]
+                                  + end[k])
+
+
+@njit(cache=True)
+def compute_frame(a, b, g, length, t_unit, cube_pts, cube_faces,
+                  end, R, link, arc_a, arc_b, faces, tick):
+    """Fill every dynamic vertex buffer of the arm view for one pose.
+
+    `compute_arm_lines` followed by `compute_cube_faces`; see those for
+    the buffer shapes.
+    """
+    compute_arm_lines(a, b, g, length, t_unit, end, R, link, arc_a, arc_b, tick)
+    compute_cube_faces(cube_pts, cube_faces, end, R, faces)
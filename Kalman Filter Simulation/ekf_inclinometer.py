@@ -11,11 +11,17 @@ pitch from accelerometer-derived angles.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Tuple
 
 import numpy as np
 
+from numba_compat import njit
+
+
+HALF_PI = np.pi * 0.5
+
 
 @dataclass
 class EKFConfig:
@@ -24,6 +30,157 @@ class EKFConfig:
     q_bias: float = 1e-8
     r_roll: float = (0.01) ** 2
     r_pitch: float = (0.01) ** 2
+    # Record innovations / innovation covariances for ALS-style tuning.
+    # Off by default; log_capacity preallocates that many updates (the
+    # buffers grow if it is exceeded).
+    log_innovations: bool = False
+    log_capacity: int = 0
+
+
+# ----------------------------------------------------------------------
+# Numeric kernels
+#
+# The filter works on fixed 5x5 / 2x2 matrices, where numpy dispatch
+# overhead dominates the actual arithmetic. The kernels below operate
+# in place on x and P with explicit loops so they can be compiled by
+# numba when it is installed.
+# ----------------------------------------------------------------------
+@njit(cache=True)
+def _predict_core(x, P, wx_m, wy_m, wz_m, dt, q_roll, q_pitch, q_bias, dF, dFP):
+    """Propagate x (5,) and P (5, 5) in place using one gyro sample.
+
+    dF and dFP are (2, 5) scratch buffers.
+    """
+
+    roll = x[0]
+    pitch = x[1]
+
+    # Bias-corrected body rates
+    wx = wx_m - x[2]
+    wy = wy_m - x[3]
+    wz = wz_m - x[4]
+
+    # Guard against gimbal lock
+    eps = 1e-6
+    if abs(abs(pitch) - HALF_PI) < eps:
+        pitch = (1.0 if pitch > 0 else -1.0) * (HALF_PI - eps)
+
+    sr, cr = math.sin(roll), math.cos(roll)
+    tp = math.tan(pitch)
+    cp = math.cos(pitch)
+
+    # Shared subexpressions of the rates and their Jacobian
+    wy_sr = wy * sr
+    wy_cr = wy * cr
+    wz_sr = wz * sr
+    wz_cr = wz * cr
+    sr_tp = sr * tp
+    cr_tp = cr * tp
+
+    roll_dot = wx + (wy_sr + wz_cr) * tp
+    pitch_dot = wy_cr - wz_sr
+
+    # Discrete-time state prediction (Euler integration); biases are
+    # unchanged
+    x[0] = roll + roll_dot * dt
+    x[1] = pitch + pitch_dot * dt
+
+    # Jacobian F = df/dx = I + dF, where only the roll and pitch rows
+    # of dF are nonzero (biases are a random walk).
+    #
+    # Derivatives of roll_dot / pitch_dot wrt roll, pitch and, via
+    # wx = wx_m - bx etc., wrt the biases.
+    sec_p2 = 1.0 / (cp * cp)
+    dF[0, 0] = (wy_cr - wz_sr) * tp * dt
+    dF[0, 1] = (wy_sr + wz_cr) * sec_p2 * dt
+    dF[0, 2] = -dt
+    dF[0, 3] = -sr_tp * dt
+    dF[0, 4] = -cr_tp * dt
+
+    dF[1, 0] = -(wy_sr + wz_cr) * dt
+    dF[1, 1] = 0.0
+    dF[1, 2] = 0.0
+    dF[1, 3] = -cr * dt
+    dF[1, 4] = sr * dt
+
+    # F P F^T = P + dF P + P dF^T + dF P dF^T, where the dF terms only
+    # touch the first two rows/columns
+    for i in range(2):
+        for j in range(5):
+            acc = 0.0
+            for k in range(5):
+                acc += dF[i, k] * P[k, j]
+            dFP[i, j] = acc
+
+    for i in range(2):
+        for j in range(2):
+            acc = 0.0
+            for k in range(5):
+                acc += dFP[i, k] * dF[j, k]
+            P[i, j] += acc
+    for i in range(2):
+        for j in range(5):
+            P[i, j] += dFP[i, j]
+    for i in range(5):
+        for j in range(2):
+            P[i, j] += dFP[j, i]
+
+    # Process noise covariance Q (diagonal)
+    P[0, 0] += q_roll * dt
+    P[1, 1] += q_pitch * dt
+    P[2, 2] += q_bias * dt
+    P[3, 3] += q_bias * dt
+    P[4, 4] += q_bias * dt
+
+
+@njit(cache=True)
+def _update_core(x, P, z_roll, z_pitch, r_roll, r_pitch, y, S, K, AP):
+    """Measurement update of x and P in place.
+
+    The innovation and its covariance are written into y (2,) and
+    S (2, 2). K (5, 2) and AP (5, 5) are scratch buffers.
+    """
+
+    # Measurement model: h(x) = [roll, pitch]. H = [I_2 | 0] only
+    # selects the first two states, so H @ x, H @ P @ H^T and P @ H^T
+    # are read straight out of x and P.
+    y[0] = z_roll - x[0]
+    y[1] = z_pitch - x[1]
+
+    S[0, 0] = P[0, 0] + r_roll
+    S[0, 1] = P[0, 1]
+    S[1, 0] = P[1, 0]
+    S[1, 1] = P[1, 1] + r_pitch
+
+    # K = P H^T S^-1 with the closed-form 2x2 inverse
+    inv_det = 1.0 / (S[0, 0] * S[1, 1] - S[0, 1] * S[1, 0])
+    Si00 = S[1, 1] * inv_det
+    Si01 = -S[0, 1] * inv_det
+    Si10 = -S[1, 0] * inv_det
+    Si11 = S[0, 0] * inv_det
+
+    for i in range(5):
+        K[i, 0] = P[i, 0] * Si00 + P[i, 1] * Si10
+        K[i, 1] = P[i, 0] * Si01 + P[i, 1] * Si11
+
+    for i in range(5):
+        x[i] += K[i, 0] * y[0] + K[i, 1] * y[1]
+
+    # Joseph form (I-KH) P (I-KH)^T + K R K^T, applying each (I-KH)
+    # factor through the selector structure of H = [I_2 | 0]
+    for i in range(5):
+        for j in range(5):
+            AP[i, j] = P[i, j] - K[i, 0] * P[0, j] - K[i, 1] * P[1, j]
+
+    for i in range(5):
+        for j in range(5):
+            P[i, j] = (
+                AP[i, j]
+                - AP[i, 0] * K[j, 0]
+                - AP[i, 1] * K[j, 1]
+                + K[i, 0] * r_roll * K[j, 0]
+                + K[i, 1] * r_pitch * K[j, 1]
+            )
 
 
 class InclinometerEKF:
@@ -32,9 +189,34 @@ class InclinometerEKF:
         # State: roll, pitch, bx, by, bz
         self.x = np.zeros(5)
         self.P = np.eye(5)
-        # Logs for ALS-style tuning: store innovations and innovation covariances
-        self.innovation_log: list[np.ndarray] = []
-        self.S_log: list[np.ndarray] = []
+        # Work buffers reused by every predict/update call
+        self._dF = np.empty((2, 5))
+        self._dFP = np.empty((2, 5))
+        self._y = np.empty(2)
+        self._S = np.empty((2, 2))
+        self._K = np.empty((5, 2))
+        self._AP = np.empty((5, 5))
+        # Logs for ALS-style tuning: innovations and innovation covariances
+        self._log_i = 0
+        self._inn_buf = np.empty((0, 2))
+        self._S_buf = np.empty((0, 2, 2))
+        if self.config.log_innovations:
+            capacity = max(self.config.log_capacity, 1)
+            self._inn_buf = np.empty((capacity, 2))
+            self._S_buf = np.empty((capacity, 2, 2))
+
+    @property
+    def innovation_log(self) -> np.ndarray:
+        """Logged innovations, shape (n_updates, 2)."""
+        return self._inn_buf[: self._log_i]
+
+    @property
+    def S_log(self) -> np.ndarray:
+        """Logged innovation covariances, shape (n_updates, 2, 2)."""
+        return self._S_buf[: self._log_i]
+
+    def clear_logs(self) -> None:
+        self._log_i = 0
 
     # ------------------------------------------------------------------
     # Process / measurement models
@@ -45,91 +227,14 @@ class InclinometerEKF:
         gyro_meas is a 3-element array [wx_meas, wy_meas, wz_meas].
         """
 
-        roll, pitch, bx, by, bz = self.x
         wx_m, wy_m, wz_m = gyro_meas
-
-        # Bias-corrected body rates
-        wx = wx_m - bx
-        wy = wy_m - by
-        wz = wz_m - bz
-
-        # Guard against gimbal lock
-        eps = 1e-6
-        if np.isclose(np.abs(pitch), np.pi / 2.0, atol=eps):
-            pitch = np.sign(pitch) * (np.pi / 2.0 - eps)
-
-        sr, cr = np.sin(roll), np.cos(roll)
-        tp = np.tan(pitch)
-        cp = np.cos(pitch)
-
-        roll_dot = wx + wy * sr * tp + wz * cr * tp
-        pitch_dot = wy * cr - wz * sr
-
-        # Discrete-time state prediction (Euler integration)
-        roll_pred = roll + roll_dot * dt
-        pitch_pred = pitch + pitch_dot * dt
-        bx_pred = bx
-        by_pred = by
-        bz_pred = bz
-
-        self.x[:] = [roll_pred, pitch_pred, bx_pred, by_pred, bz_pred]
-
-        # Jacobian F = df/dx
-        F = np.eye(5)
-
-        # Partial derivatives of roll_dot and pitch_dot wrt roll, pitch, biases
-        # For small dt, we approximate using current state
-        # roll_dot = f1(roll, pitch, bx, by, bz)
-        # pitch_dot = f2(roll, pitch, bx, by, bz)
-
-        # Derivatives wrt roll
-        droll_dot_droll = (
-            wy * cr * tp
-            + wz * (-sr) * tp
+        cfg = self.config
+        _predict_core(
+            self.x, self.P,
+            float(wx_m), float(wy_m), float(wz_m), float(dt),
+            cfg.q_roll, cfg.q_pitch, cfg.q_bias,
+            self._dF, self._dFP,
         )
-        dpitch_dot_droll = -wy * sr - wz * cr
-
-        # Derivatives wrt pitch
-        sec_p2 = 1.0 / (cp * cp)
-        droll_dot_dpitch = wy * sr * sec_p2 + wz * cr * sec_p2
-        dpitch_dot_dpitch = 0.0
-
-        # Derivatives wrt biases (bx, by, bz) via wx, wy, wz
-        # wx = wx_m - bx -> d(wx)/d(bx) = -1
-        # wy = wy_m - by -> d(wy)/d(by) = -1
-        # wz = wz_m - bz -> d(wz)/d(bz) = -1
-
-        droll_dot_dbx = -1.0
-        dpitch_dot_dbx = 0.0
-
-        droll_dot_dby = -sr * tp
-        dpitch_dot_dby = -cr
-
-        droll_dot_dbz = -cr * tp
-        dpitch_dot_dbz = sr
-
-        # F entries for roll and pitch rows
-        F[0, 0] += droll_dot_droll * dt
-        F[0, 1] += droll_dot_dpitch * dt
-        F[0, 2] += droll_dot_dbx * dt
-        F[0, 3] += droll_dot_dby * dt
-        F[0, 4] += droll_dot_dbz * dt
-
-        F[1, 0] += dpitch_dot_droll * dt
-        F[1, 1] += dpitch_dot_dpitch * dt
-        F[1, 2] += dpitch_dot_dbx * dt
-        F[1, 3] += dpitch_dot_dby * dt
-        F[1, 4] += dpitch_dot_dbz * dt
-
-        # Process noise covariance Q
-        Q = np.zeros((5, 5))
-        Q[0, 0] = self.config.q_roll * dt
-        Q[1, 1] = self.config.q_pitch * dt
-        Q[2, 2] = self.config.q_bias * dt
-        Q[3, 3] = self.config.q_bias * dt
-        Q[4, 4] = self.config.q_bias * dt
-
-        self.P = F @ self.P @ F.T + Q
 
     def update(self, z: Tuple[float, float]) -> None:
         """Update with accelerometer-based roll and pitch measurement.
@@ -139,31 +244,22 @@ class InclinometerEKF:
 
         roll_meas, pitch_meas = z
 
-        # Measurement model: h(x) = [roll, pitch]
-        H = np.array(
-            [
-                [1.0, 0.0, 0.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0, 0.0, 0.0],
-            ]
+        _update_core(
+            self.x, self.P,
+            float(roll_meas), float(pitch_meas),
+            self.config.r_roll, self.config.r_pitch,
+            self._y, self._S, self._K, self._AP,
         )
 
-        R = np.diag([self.config.r_roll, self.config.r_pitch])
-
-        z_vec = np.array([roll_meas, pitch_meas])
-        h = H @ self.x
-        y = z_vec - h
-
-        S = H @ self.P @ H.T + R
-
         # Log innovation and its covariance for ALS-style Q/R estimation
-        self.innovation_log.append(y.copy())
-        self.S_log.append(S.copy())
-
-        K = self.P @ H.T @ np.linalg.inv(S)
-
-        self.x = self.x + K @ y
-        I = np.eye(5)
-        self.P = (I - K @ H) @ self.P
+        if self.config.log_innovations:
+            i = self._log_i
+            if i == self._inn_buf.shape[0]:
+                self._inn_buf = np.concatenate([self._inn_buf, np.empty_like(self._inn_buf)])
+                self._S_buf = np.concatenate([self._S_buf, np.empty_like(self._S_buf)])
+            self._inn_buf[i] = self._y
+            self._S_buf[i] = self._S
+            self._log_i = i + 1
 
     def get_state(self) -> Tuple[float, float, float, float, float]:
         roll, pitch, bx, by, bz = self.x
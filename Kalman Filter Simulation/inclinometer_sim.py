@@ -20,8 +20,18 @@ and we explicitly use rotation matrices instead of quaternions.
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
+HALF_PI = np.pi * 0.5
+
+
+def _sincos(a: float) -> tuple[float, float]:
+    """Scalar (sin, cos) via the math module, cheaper than numpy on floats."""
+
+    return math.sin(a), math.cos(a)
+
 
 class InclinometerSim:
     """IMU / inclinometer simulator.
@@ -65,6 +75,11 @@ class InclinometerSim:
         # Random number generator
         self.rng = rng if rng is not None else np.random.default_rng()
 
+        # Most recent (roll, pitch, yaw) -> R_bw, reused by read_accel
+        # while orientation is unchanged
+        self._last_rpy: tuple[float, float, float] | None = None
+        self._last_R: np.ndarray | None = None
+
     # ------------------------------------------------------------------
     # Orientation and kinematics helpers
     # ------------------------------------------------------------------
@@ -80,24 +95,51 @@ class InclinometerSim:
         into body coordinates by v_b = R_bw @ v_w.
         """
 
+        sr, cr = _sincos(roll)
+        sp, cp = _sincos(pitch)
+        sy, cy = _sincos(yaw)
+
+        # Closed form of Rx @ Ry @ Rz, filled one entry at a time
+        R = np.empty((3, 3), dtype=float)
+        R[0, 0] = cp * cy
+        R[0, 1] = -cp * sy
+        R[0, 2] = sp
+        R[1, 0] = cr * sy + sr * sp * cy
+        R[1, 1] = cr * cy - sr * sp * sy
+        R[1, 2] = -sr * cp
+        R[2, 0] = sr * sy - cr * sp * cy
+        R[2, 1] = sr * cy + cr * sp * sy
+        R[2, 2] = cr * cp
+        return R
+
+    @staticmethod
+    def _rotation_matrix_batch(
+        roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized `_rotation_matrix` over (N,) angle arrays.
+
+        Returns an (N, 3, 3) stack of R_bw matrices.
+        """
+
+        roll = np.asarray(roll, dtype=float)
+        pitch = np.asarray(pitch, dtype=float)
+        yaw = np.asarray(yaw, dtype=float)
+
         cr, sr = np.cos(roll), np.sin(roll)
         cp, sp = np.cos(pitch), np.sin(pitch)
         cy, sy = np.cos(yaw), np.sin(yaw)
 
-        Rx = np.array(
-            [[1.0, 0.0, 0.0], [0.0, cr, -sr], [0.0, sr, cr]],
-            dtype=float,
-        )
-        Ry = np.array(
-            [[cp, 0.0, sp], [0.0, 1.0, 0.0], [-sp, 0.0, cp]],
-            dtype=float,
-        )
-        Rz = np.array(
-            [[cy, -sy, 0.0], [sy, cy, 0.0], [0.0, 0.0, 1.0]],
-            dtype=float,
-        )
-
-        return Rx @ Ry @ Rz
+        R = np.empty(roll.shape + (3, 3), dtype=float)
+        R[..., 0, 0] = cp * cy
+        R[..., 0, 1] = -cp * sy
+        R[..., 0, 2] = sp
+        R[..., 1, 0] = cr * sy + sr * sp * cy
+        R[..., 1, 1] = cr * cy - sr * sp * sy
+        R[..., 1, 2] = -sr * cp
+        R[..., 2, 0] = sr * sy - cr * sp * cy
+        R[..., 2, 1] = sr * cy + cr * sp * sy
+        R[..., 2, 2] = cr * cp
+        return R
 
     def set_orientation(self, roll: float, pitch: float, yaw: float) -> None:
         self.roll = float(roll)
@@ -105,10 +147,14 @@ class InclinometerSim:
         self.yaw = float(yaw)
 
     def set_linear_accel_body(self, ax: float, ay: float, az: float) -> None:
-        self.linear_accel_body[:] = [ax, ay, az]
+        self.linear_accel_body[0] = ax
+        self.linear_accel_body[1] = ay
+        self.linear_accel_body[2] = az
 
     def set_angular_velocity_body(self, wx: float, wy: float, wz: float) -> None:
-        self.angular_velocity_body[:] = [wx, wy, wz]
+        self.angular_velocity_body[0] = wx
+        self.angular_velocity_body[1] = wy
+        self.angular_velocity_body[2] = wz
 
     # ------------------------------------------------------------------
     # Sensor simulation
@@ -119,7 +165,13 @@ class InclinometerSim:
         a_meas = a_body_linear + R_bw @ g_world + noise
         """
 
-        R_bw = self._rotation_matrix(self.roll, self.pitch, self.yaw)
+        rpy = (self.roll, self.pitch, self.yaw)
+        if rpy == self._last_rpy:
+            R_bw = self._last_R
+        else:
+            R_bw = self._rotation_matrix(*rpy)
+            self._last_rpy = rpy
+            self._last_R = R_bw
         gravity_body = R_bw @ self.g_world
         accel_true = self.linear_accel_body + gravity_body
         noise = self.rng.normal(0.0, self.accel_noise_std, size=3)
@@ -134,6 +186,33 @@ class InclinometerSim:
         noise = self.rng.normal(0.0, self.gyro_noise_std, size=3)
         return self.angular_velocity_body + self.gyro_bias + noise
 
+    def read_accel_batch(
+        self,
+        roll: np.ndarray,
+        pitch: np.ndarray,
+        yaw: np.ndarray,
+        linear_accel_body: np.ndarray,
+    ) -> np.ndarray:
+        """Simulate N accelerometer readings at once.
+
+        Same model as `read_accel`, evaluated for (N,) orientation
+        arrays and an (N, 3) body-frame linear acceleration. Returns
+        an (N, 3) array. Does not change the simulator's orientation.
+        """
+
+        R_bw = self._rotation_matrix_batch(roll, pitch, yaw)
+        gravity_body = np.einsum("nij,j->ni", R_bw, self.g_world)
+        accel_true = np.asarray(linear_accel_body, dtype=float) + gravity_body
+        noise = self.rng.standard_normal(accel_true.shape) * self.accel_noise_std
+        return accel_true + noise
+
+    def read_gyro_batch(self, angular_velocity_body: np.ndarray) -> np.ndarray:
+        """Simulate N gyroscope readings from an (N, 3) array of body rates."""
+
+        omega = np.asarray(angular_velocity_body, dtype=float)
+        noise = self.rng.standard_normal(omega.shape) * self.gyro_noise_std
+        return omega + self.gyro_bias + noise
+
     # ------------------------------------------------------------------
     # Derived orientation from accelerometer
     # ------------------------------------------------------------------
@@ -160,6 +239,23 @@ class InclinometerSim:
         roll = -np.arctan2(-ay, -az)
         return float(roll), float(pitch)
 
+    @staticmethod
+    def roll_pitch_from_accel_batch(accel_body: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized `roll_pitch_from_accel` over an (N, 3) accel trace.
+
+        Returns (roll, pitch) as (N,) arrays.
+        """
+
+        accel_body = np.asarray(accel_body, dtype=float)
+        ax = accel_body[:, 0]
+        ay = accel_body[:, 1]
+        az = accel_body[:, 2]
+
+        denom = np.sqrt(ay * ay + az * az)
+        pitch = np.where(denom < 1e-9, 0.0, np.arctan2(-ax, denom))
+        roll = -np.arctan2(-ay, -az)
+        return roll, pitch
+
     def read_roll_pitch_from_accel(self) -> tuple[float, float]:
         """Convenience wrapper: simulate accel then compute roll/pitch."""
 
@@ -182,12 +278,12 @@ class InclinometerSim:
 
         # Guard against gimbal lock at pitch = +/- pi/2
         eps = 1e-6
-        if np.isclose(np.abs(pitch), np.pi / 2.0, atol=eps):
-            pitch = np.sign(pitch) * (np.pi / 2.0 - eps)
+        if abs(abs(pitch) - HALF_PI) < eps:
+            pitch = (1.0 if pitch > 0 else -1.0) * (HALF_PI - eps)
 
-        sr, cr = np.sin(roll), np.cos(roll)
-        tp = np.tan(pitch)
-        cp = np.cos(pitch)
+        sr, cr = _sincos(roll)
+        tp = math.tan(pitch)
+        cp = math.cos(pitch)
 
         roll_dot = wx + wy * sr * tp + wz * cr * tp
         pitch_dot = wy * cr - wz * sr
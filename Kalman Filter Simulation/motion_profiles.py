@@ -5,6 +5,10 @@ Each profile is a function that, given time t, returns:
 - orientation (roll, pitch, yaw)
 - linear acceleration in body frame (ax, ay, az)
 - angular velocity in body frame (wx, wy, wz)
+
+Every profile also carries a vectorized form as `profile.batch(t_arr)`,
+which evaluates an (N,) time array in one pass and returns
+(orientation, accel, omega) as (N, 3) arrays.
 """
 
 from __future__ import annotations
@@ -16,6 +20,21 @@ import numpy as np
 Orientation = Tuple[float, float, float]
 Accel = Tuple[float, float, float]
 Omega = Tuple[float, float, float]
+BatchProfile = Callable[[np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+
+def _constant_batch(orientation: Orientation, accel: Accel, omega: Omega) -> BatchProfile:
+    """Vectorized form of a profile whose outputs do not depend on t."""
+
+    def batch(t_arr: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = np.shape(t_arr)[0]
+        return (
+            np.tile(np.asarray(orientation, dtype=float), (n, 1)),
+            np.tile(np.asarray(accel, dtype=float), (n, 1)),
+            np.tile(np.asarray(omega, dtype=float), (n, 1)),
+        )
+
+    return batch
 
 
 def static_orientation(orientation: Orientation) -> Callable[[float], tuple[Orientation, Accel, Omega]]:
@@ -28,6 +47,7 @@ def static_orientation(orientation: Orientation) -> Callable[[float], tuple[Orie
     def profile(t: float) -> tuple[Orientation, Accel, Omega]:  # noqa: ARG001
         return orientation, (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)
 
+    profile.batch = _constant_batch(orientation, (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
     return profile
 
 
@@ -68,6 +88,30 @@ def sinusoidal_orientation(
 
         return (roll, pitch, yaw), (0.0, 0.0, 0.0), (wx, wy, wz)
 
+    def batch(t_arr: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        t_arr = np.asarray(t_arr, dtype=float)
+        w_r = 2.0 * np.pi * roll_freq
+        w_p = 2.0 * np.pi * pitch_freq
+
+        orientation = np.stack(
+            [
+                roll_amp * np.sin(w_r * t_arr),
+                pitch_amp * np.sin(w_p * t_arr),
+                yaw_rate * t_arr,
+            ],
+            axis=1,
+        )
+        omega = np.stack(
+            [
+                roll_amp * w_r * np.cos(w_r * t_arr),
+                pitch_amp * w_p * np.cos(w_p * t_arr),
+                np.full_like(t_arr, yaw_rate),
+            ],
+            axis=1,
+        )
+        return orientation, np.zeros((t_arr.shape[0], 3)), omega
+
+    profile.batch = batch
     return profile
 
 
@@ -90,6 +134,7 @@ def pure_linear_accel_world(
     def profile(t: float) -> tuple[Orientation, Accel, Omega]:  # noqa: ARG001
         return orientation, accel_world, (0.0, 0.0, 0.0)
 
+    profile.batch = _constant_batch(orientation, accel_world, (0.0, 0.0, 0.0))
     return profile
 
 
@@ -125,6 +170,22 @@ def pure_angular_motion(
 
         return (roll, pitch, yaw), (0.0, 0.0, 0.0), (wx, wy, wz)
 
+    def batch(t_arr: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        t_arr = np.asarray(t_arr, dtype=float)
+        w = 2.0 * np.pi * osc_freq
+        sin_wt = np.sin(w * t_arr)
+        one_minus_cos_wt = 1.0 - np.cos(w * t_arr)
+
+        def angle(b: float, o: float) -> np.ndarray:
+            if w == 0.0 or o == 0.0:
+                return b * t_arr
+            return b * t_arr + (o / w) * one_minus_cos_wt
+
+        orientation = np.stack([angle(bx, ox), angle(by, oy), angle(bz, oz)], axis=1)
+        omega = np.stack([bx + ox * sin_wt, by + oy * sin_wt, bz + oz * sin_wt], axis=1)
+        return orientation, np.zeros((t_arr.shape[0], 3)), omega
+
+    profile.batch = batch
     return profile
 
 
@@ -152,6 +213,22 @@ def mixed_linear_angular_demo() -> Callable[[float], tuple[Orientation, Accel, O
 
         return (roll, pitch, yaw), (ax, ay, az), (wx, wy, wz)
 
+    def batch(t_arr: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        t_arr = np.asarray(t_arr, dtype=float)
+        zeros = np.zeros_like(t_arr)
+        yaw_rate = 0.2  # rad/s
+        wt = 2.0 * np.pi * 0.5 * t_arr
+        sin_wt = np.sin(wt)
+
+        orientation = np.stack([0.05 * sin_wt, zeros, yaw_rate * t_arr], axis=1)
+        accel = np.stack([0.5 * sin_wt, zeros, zeros], axis=1)
+        omega = np.stack(
+            [0.05 * 2.0 * np.pi * 0.5 * np.cos(wt), zeros, np.full_like(t_arr, yaw_rate)],
+            axis=1,
+        )
+        return orientation, accel, omega
+
+    profile.batch = batch
     return profile
 
 
@@ -183,4 +260,17 @@ def high_freq_vibration_profile(
 
         return (roll, pitch, yaw), (ax, ay, az), (wx, wy, wz)
 
+    def batch(t_arr: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        t_arr = np.asarray(t_arr, dtype=float)
+        zeros = np.zeros_like(t_arr)
+        w_p = 2.0 * np.pi * 0.1
+
+        orientation = np.stack([zeros, pitch_rate * np.sin(w_p * t_arr), zeros], axis=1)
+        accel = np.stack(
+            [lin_accel_amp * np.sin(2.0 * np.pi * vib_freq * t_arr), zeros, zeros], axis=1
+        )
+        omega = np.stack([zeros, pitch_rate * w_p * np.cos(w_p * t_arr), zeros], axis=1)
+        return orientation, accel, omega
+
+    profile.batch = batch
     return profile
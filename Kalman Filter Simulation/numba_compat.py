@@ -0,0 +1,15 @@
+"""Optional numba support for the numeric kernels.
+
+`njit` is numba's decorator when numba is installed; otherwise it is a
+no-op so the decorated kernels run as plain Python.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
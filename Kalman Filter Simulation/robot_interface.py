@@ -24,19 +24,21 @@ Angle ranges:
 
 from __future__ import annotations
 
+import collections
 import json
+import math
 import os
-import queue
 import sys
 import threading
 import time
+from typing import NamedTuple
 
 import numpy as np
 import serial
 import serial.tools.list_ports
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
-from PyQt6.QtGui import QFont, QColor, QIcon, QAction
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QSignalBlocker, QEventLoop
+from PyQt6.QtGui import QFont, QColor, QIcon, QAction, QTextCursor, QTextCharFormat
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGroupBox, QLabel, QComboBox, QPushButton, QDoubleSpinBox,
@@ -51,12 +53,57 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
+from arm_math import compute_arm_lines, compute_frame
+
+try:
+    import pyqtgraph as pg
+    import pyqtgraph.opengl as gl
+except ImportError:  # pyqtgraph is optional; fall back to the matplotlib view
+    pg = gl = None
+
 # ── Arm constants ────────────────────────────────────────────────────────────
 ARM_LENGTH = 1.0
 
 ALPHA_MIN, ALPHA_MAX = 0.0, 360.0
 BETA_MIN,  BETA_MAX  = 0.0, 180.0
 GAMMA_MIN, GAMMA_MAX = 0.0, 360.0
+VIEW_EPS_DEG = 0.05         # pose changes smaller than this don't redraw the view
+
+# ── Command sequences ────────────────────────────────────────────────────────
+STEP_MOVE_ABS, STEP_MOVE_REL, STEP_DELAY, STEP_HOME = range(4)
+STEP_KINDS = {"move_abs": STEP_MOVE_ABS, "move_rel": STEP_MOVE_REL,
+              "delay": STEP_DELAY, "home": STEP_HOME}
+STEP_NAMES = tuple(STEP_KINDS)          # indexed by kind
+
+
+class Step(NamedTuple):
+    """One validated sequence step; angles are NaN where move_abs keeps the current value."""
+    kind: int
+    a: float
+    b: float
+    g: float
+    spd: float
+    t: float
+
+
+def parse_step(i: int, c: dict) -> Step:
+    """Validate JSON step *c* (0-based index *i*) into a Step."""
+    if "command" not in c:
+        raise ValueError(f"Step {i+1}: missing 'command' key")
+    kind = STEP_KINDS.get(c["command"])
+    if kind is None:
+        raise ValueError(f"Step {i+1}: unknown command '{c['command']}'")
+    # move_abs leaves unspecified axes where they are; move_rel leaves them unchanged
+    dflt = math.nan if kind == STEP_MOVE_ABS else 0.0
+    try:
+        return Step(kind,
+                    float(c.get("alpha", dflt)),
+                    float(c.get("beta",  dflt)),
+                    float(c.get("gamma", dflt)),
+                    float(c.get("speed", 30.0)),
+                    float(c.get("time",  1.0)))
+    except (TypeError, ValueError):
+        raise ValueError(f"Step {i+1}: non-numeric value") from None
 
 # ── Dark theme stylesheet ────────────────────────────────────────────────────
 DARK_STYLE = """
@@ -167,13 +214,23 @@ QSplitter::handle { background-color: #45475a; width: 3px; }
 # ═════════════════════════════════════════════════════════════════════════════
 #  Serial Interface
 # ═════════════════════════════════════════════════════════════════════════════
+# wire commands, pre-encoded; the numeric ones are filled in with bytes %-formatting
+_CMD_MOVE_ABS = b"CMD:MOVE_ABS %.2f %.2f %.2f %.2f\n"
+_CMD_MOVE_REL = b"CMD:MOVE_REL %.2f %.2f %.2f %.2f\n"
+_CMD_HOME     = b"CMD:HOME %.2f\n"
+_CMD_STOP     = b"CMD:STOP\n"
+_CMD_QUERY    = b"CMD:QUERY\n"
+
 class SerialInterface:
     """Thread-safe serial link to the Arduino controller."""
 
     def __init__(self):
         self.ser: serial.Serial | None = None
         self.connected = False
-        self.rx_queue: queue.Queue[str] = queue.Queue()
+        # single producer (reader thread) / single consumer (GUI): deque
+        # append/popleft are atomic, so no lock is needed
+        self._rx: collections.deque[str] = collections.deque(maxlen=4096)
+        self._done_event = threading.Event()     # set when the Arduino reports DONE
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
 
@@ -182,7 +239,12 @@ class SerialInterface:
         return [p.device for p in serial.tools.list_ports.comports()]
 
     def connect(self, port: str, baudrate: int = 115200):
-        self.ser = serial.Serial(port, baudrate, timeout=0.1)
+        # short timeout: the reader blocks in read() rather than sleeping
+        self.ser = serial.Serial(port, baudrate, timeout=0.02)
+        try:
+            self.ser.set_low_latency_mode(True)   # Linux ASYNC_LOW_LATENCY
+        except (AttributeError, OSError, ValueError):
+            pass                                  # not supported on this platform/driver
         self.connected = True
         self._stop.clear()
         self._thread = threading.Thread(target=self._read_loop, daemon=True)
@@ -197,59 +259,106 @@ class SerialInterface:
         self.connected = False
 
     def _read_loop(self):
+        buf = bytearray()
+        ser = self.ser
         while not self._stop.is_set():
             try:
-                if self.ser and self.ser.is_open and self.ser.in_waiting:
-                    line = self.ser.readline().decode("utf-8", errors="ignore").strip()
-                    if line:
-                        self.rx_queue.put(line)
+                if not (ser and ser.is_open):
+                    break
+                # take everything pending, or block up to `timeout` for one byte
+                chunk = ser.read(ser.in_waiting or 1)
             except (serial.SerialException, OSError):
                 self.connected = False
                 break
-            time.sleep(0.005)
-
-    def _send(self, cmd: str) -> bool:
+            if not chunk:
+                continue
+            buf += chunk
+            while (nl := buf.find(b"\n")) >= 0:
+                line = buf[:nl].decode("utf-8", errors="ignore").strip()
+                del buf[:nl + 1]
+                if line:
+                    self._rx.append(line)
+                    if line == "DONE":
+                        self._done_event.set()
+
+    def _send(self, cmd: bytes) -> bool:
         if self.ser and self.ser.is_open:
-            self.ser.write(f"{cmd}\n".encode())
+            # a new command invalidates any earlier DONE
+            self._done_event.clear()
+            self.ser.write(cmd)
             return True
         return False
 
     def send_move_abs(self, a, b, g, speed):
-        return self._send(f"CMD:MOVE_ABS {a:.2f} {b:.2f} {g:.2f} {speed:.2f}")
+        return self._send(_CMD_MOVE_ABS % (a, b, g, speed))
 
     def send_move_rel(self, a, b, g, speed):
-        return self._send(f"CMD:MOVE_REL {a:.2f} {b:.2f} {g:.2f} {speed:.2f}")
+        return self._send(_CMD_MOVE_REL % (a, b, g, speed))
 
     def send_stop(self):
-        return self._send("CMD:STOP")
+        return self._send(_CMD_STOP)
 
     def send_home(self, speed: float = 30.0):
-        return self._send(f"CMD:HOME {speed:.2f}")
+        return self._send(_CMD_HOME % speed)
 
     def send_query(self):
-        return self._send("CMD:QUERY")
+        return self._send(_CMD_QUERY)
+
+    def wait_done(self, timeout: float) -> bool:
+        """Block until DONE is received after the last command, or timeout."""
+        return self._done_event.wait(timeout)
 
     def drain(self) -> list[str]:
         msgs: list[str] = []
-        while not self.rx_queue.empty():
-            try:
-                msgs.append(self.rx_queue.get_nowait())
-            except queue.Empty:
-                break
+        rx = self._rx
+        try:
+            while True:
+                msgs.append(rx.popleft())
+        except IndexError:
+            pass
         return msgs
 
 
 # ═════════════════════════════════════════════════════════════════════════════
-#  3-D Arm Visualisation (Matplotlib canvas for Qt)
+#  3-D Arm Visualisation
 # ═════════════════════════════════════════════════════════════════════════════
+# reference cube corners (edge 1) and the corner indices of its six faces
+_CUBE_PTS = 0.5 * np.array([[-1,-1,-1],[1,-1,-1],[1,1,-1],[-1,1,-1],
+                            [-1,-1, 1],[1,-1, 1],[1,1, 1],[-1,1, 1]], dtype=float)
+_CUBE_FACES = np.array([[0,1,2,3],[4,5,6,7],[0,1,5,4],
+                        [2,3,7,6],[1,2,6,5],[0,3,7,4]])
+
+
 class ArmCanvas(FigureCanvasQTAgg):
-    """Matplotlib 3-D viewport embedded as a QWidget."""
+    """Matplotlib 3-D viewport embedded as a QWidget.
+
+    Static primitives (base sphere, origin axes) are drawn once. The
+    arm link, arcs, end-effector cube, γ tick and title are persistent
+    animated artists whose data is updated in place and blitted over a
+    cached background.
+    """
 
     def __init__(self, parent: QWidget | None = None):
         self.fig = Figure(figsize=(6, 6), dpi=100, facecolor="#1e1e2e")
         super().__init__(self.fig)
         self.ax = self.fig.add_subplot(111, projection="3d")
         self._style_axes()
+        self._build_static()
+        self._build_dynamic()
+        self._bg = None
+        # vertex buffers refilled in place by arm_math.compute_frame; the
+        # artists keep references to them, so each artist owns its own
+        self._cube_pts = _CUBE_PTS * 0.14
+        self._t_unit = np.linspace(0.0, 1.0, 40)
+        self._end = np.empty(3)
+        self._R_ee = np.empty((3, 3))
+        self._link_xyz = np.empty((3, 2))
+        self._alpha_xyz = np.empty((3, 40))
+        self._beta_xyz = np.empty((3, 40))
+        self._cube_verts = np.empty((6, 4, 3))
+        self._tick_xyz = np.empty((3, 2))
+        # any full redraw (resize, view rotation, toolbar) refreshes the background
+        self.mpl_connect("draw_event", self._on_draw)
         self.update_arm(0, 0, 0)
 
     # ── cosmetics ─────────────────────────────────────────────────────────
@@ -272,25 +381,8 @@ class ArmCanvas(FigureCanvasQTAgg):
         ax.zaxis.pane.set_edgecolor("#45475a")
         ax.view_init(elev=25, azim=45)
 
-    @staticmethod
-    def _cube_faces(center: np.ndarray, size: float, R: np.ndarray):
-        s = size / 2
-        pts = np.array([[-s,-s,-s],[s,-s,-s],[s,s,-s],[-s,s,-s],
-                        [-s,-s, s],[s,-s, s],[s,s, s],[-s,s, s]])
-        pts = (R @ pts.T).T + center
-        idx = [[0,1,2,3],[4,5,6,7],[0,1,5,4],[2,3,7,6],[1,2,6,5],[0,3,7,4]]
-        return [pts[f].tolist() for f in idx]
-
-    # ── redraw ────────────────────────────────────────────────────────────
-    def update_arm(self, alpha_deg: float, beta_deg: float, gamma_deg: float):
-        self.ax.cla()
-        self._style_axes()
+    def _build_static(self):
         ax = self.ax
-        a, b, g = np.radians(alpha_deg), np.radians(beta_deg), np.radians(gamma_deg)
-
-        end = ARM_LENGTH * np.array([np.sin(b)*np.cos(a),
-                                     np.sin(b)*np.sin(a),
-                                     np.cos(b)])
 
         # base sphere
         u, v = np.meshgrid(np.linspace(0, 2*np.pi, 18),
@@ -299,10 +391,6 @@ class ArmCanvas(FigureCanvasQTAgg):
         ax.plot_surface(r*np.cos(u)*np.sin(v), r*np.sin(u)*np.sin(v),
                         r*np.cos(v), color="#585b70", alpha=0.9)
 
-        # arm link
-        ax.plot([0, end[0]], [0, end[1]], [0, end[2]],
-                color="#89b4fa", linewidth=3.5, solid_capstyle="round")
-
         # origin axes
         L = 0.28
         for vec, c, lbl in [([L,0,0],"#f38ba8","X"),
@@ -311,45 +399,182 @@ class ArmCanvas(FigureCanvasQTAgg):
             ax.quiver(0, 0, 0, *vec, color=c, arrow_length_ratio=0.15, linewidth=1.2)
             ax.text(*(np.array(vec)*1.15), lbl, color=c, fontsize=8)
 
-        # α arc
-        if abs(alpha_deg) > 0.5:
-            t = np.linspace(0, a, 40)
-            R_arc = 0.22
-            ax.plot(R_arc*np.cos(t), R_arc*np.sin(t),
-                    np.zeros_like(t), color="#f38ba8", lw=1.4)
-        # β arc
-        if abs(beta_deg) > 0.5:
-            t = np.linspace(0, b, 40)
-            R_arc = 0.28
-            ax.plot(R_arc*np.sin(t)*np.cos(a), R_arc*np.sin(t)*np.sin(a),
-                    R_arc*np.cos(t), color="#a6e3a1", lw=1.4)
-
-        # end-effector cube
-        arm_dir = end / (np.linalg.norm(end) + 1e-12)
-        ref = np.array([0,0,1]) if abs(arm_dir[2]) < 0.95 else np.array([1,0,0])
-        p1 = np.cross(arm_dir, ref); p1 /= np.linalg.norm(p1)
-        p2 = np.cross(arm_dir, p1)
-        cg, sg = np.cos(g), np.sin(g)
-        rp1 =  cg*p1 + sg*p2
-        rp2 = -sg*p1 + cg*p2
-        R_ee = np.column_stack([rp1, rp2, arm_dir])
-
-        faces = self._cube_faces(end, 0.14, R_ee)
-        ax.add_collection3d(Poly3DCollection(
-            faces, alpha=0.35, facecolor="#94e2d5", edgecolor="#1e1e2e", lw=1.5))
-
-        # γ indicator tick
-        tk_ = 0.10
-        ax.plot([end[0], end[0]+tk_*rp1[0]],
-                [end[1], end[1]+tk_*rp1[1]],
-                [end[2], end[2]+tk_*rp1[2]],
-                color="#f5c2e7", lw=2.2)
-
-        ax.set_title(
-            f"α = {alpha_deg:.1f}°    β = {beta_deg:.1f}°    γ = {gamma_deg:.1f}°",
-            fontsize=11, pad=10, color="#cdd6f4")
-
-        self.draw_idle()
+    def _build_dynamic(self):
+        ax = self.ax
+        (self._link_line,) = ax.plot([0, 0], [0, 0], [0, 0],
+                                     color="#89b4fa", linewidth=3.5,
+                                     solid_capstyle="round", animated=True)
+        (self._alpha_arc,) = ax.plot([], [], [], color="#f38ba8", lw=1.4,
+                                     animated=True)
+        (self._beta_arc,) = ax.plot([], [], [], color="#a6e3a1", lw=1.4,
+                                    animated=True)
+        self._cube_poly = Poly3DCollection(
+            [], alpha=0.35, facecolor="#94e2d5", edgecolor="#1e1e2e", lw=1.5,
+            animated=True)
+        ax.add_collection3d(self._cube_poly)
+        (self._gamma_tick,) = ax.plot([0, 0], [0, 0], [0, 0],
+                                      color="#f5c2e7", lw=2.2, animated=True)
+        self._title = ax.set_title("", fontsize=11, pad=10, color="#cdd6f4")
+        self._title.set_animated(True)
+        self._dynamic = (self._link_line, self._alpha_arc, self._beta_arc,
+                         self._cube_poly, self._gamma_tick, self._title)
+
+    def set_interactive(self, enabled: bool):
+        """Toggle mouse rotate/pan/zoom; each drag forces a full redraw."""
+        if enabled:
+            self.ax.mouse_init()
+        else:
+            self.ax.disable_mouse_rotation()
+        self.ax.set_navigate(enabled)        # toolbar pan/zoom ignores the axes
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus if enabled
+                            else Qt.FocusPolicy.NoFocus)
+
+    # ── blitting ──────────────────────────────────────────────────────────
+    def _draw_dynamic(self):
+        for artist in self._dynamic:
+            if hasattr(artist, "do_3d_projection"):
+                artist.do_3d_projection()
+            self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        self._bg = self.copy_from_bbox(self.fig.bbox)
+        self._draw_dynamic()
+
+    # ── redraw ────────────────────────────────────────────────────────────
+    def update_arm(self, alpha_deg: float, beta_deg: float, gamma_deg: float):
+        compute_frame(math.radians(alpha_deg), math.radians(beta_deg),
+                      math.radians(gamma_deg), ARM_LENGTH,
+                      self._t_unit, self._cube_pts, _CUBE_FACES,
+                      self._end, self._R_ee, self._link_xyz,
+                      self._alpha_xyz, self._beta_xyz, self._cube_verts,
+                      self._tick_xyz)
+
+        self._link_line.set_data_3d(*self._link_xyz)
+        self._alpha_arc.set_data_3d(*self._alpha_xyz)
+        self._alpha_arc.set_visible(abs(alpha_deg) > 0.5)
+        self._beta_arc.set_data_3d(*self._beta_xyz)
+        self._beta_arc.set_visible(abs(beta_deg) > 0.5)
+        self._cube_poly.set_verts(self._cube_verts)
+        self._gamma_tick.set_data_3d(*self._tick_xyz)
+
+        self._title.set_text(
+            f"α = {alpha_deg:.1f}°    β = {beta_deg:.1f}°    γ = {gamma_deg:.1f}°")
+
+        if self._bg is None:
+            # no background cached yet; the full draw will paint everything
+            self.draw_idle()
+            return
+        self.restore_region(self._bg)
+        self._draw_dynamic()
+        self.blit(self.fig.bbox)
+        self.flush_events()
+
+
+if gl is not None:
+    class GLArmView(gl.GLViewWidget):
+        """OpenGL 3-D viewport (pyqtgraph), used when pyqtgraph is installed.
+
+        Every primitive is created once; `update_arm` only pushes new
+        vertex data / transforms, which are rendered on the GPU.
+        """
+
+        def __init__(self, parent: QWidget | None = None):
+            super().__init__(parent)
+            self.setBackgroundColor("#1e1e2e")
+            self.setCameraPosition(distance=ARM_LENGTH * 3, elevation=25, azimuth=45)
+
+            grid = gl.GLGridItem(color="#45475a")
+            grid.setSize(ARM_LENGTH * 2.5, ARM_LENGTH * 2.5)
+            grid.setSpacing(ARM_LENGTH * 0.25, ARM_LENGTH * 0.25)
+            self.addItem(grid)
+
+            # base sphere
+            self.addItem(gl.GLMeshItem(
+                meshdata=gl.MeshData.sphere(rows=12, cols=18, radius=0.06),
+                color=pg.mkColor("#585b70"), smooth=True, shader="shaded"))
+
+            # origin axes
+            L = 0.28
+            for vec, c, lbl in [([L,0,0],"#f38ba8","X"),
+                                ([0,L,0],"#a6e3a1","Y"),
+                                ([0,0,L],"#89b4fa","Z")]:
+                self.addItem(gl.GLLinePlotItem(
+                    pos=np.array([[0, 0, 0], vec], dtype=float),
+                    color=pg.mkColor(c), width=1.2, antialias=True))
+                self.addItem(gl.GLTextItem(pos=np.array(vec)*1.15, text=lbl,
+                                           color=pg.mkColor(c)))
+
+            # dynamic items
+            self._link_line = gl.GLLinePlotItem(
+                pos=np.zeros((2, 3)), color=pg.mkColor("#89b4fa"),
+                width=3.5, antialias=True)
+            self._alpha_arc = gl.GLLinePlotItem(
+                pos=np.zeros((2, 3)), color=pg.mkColor("#f38ba8"),
+                width=1.4, antialias=True, mode="line_strip")
+            self._beta_arc = gl.GLLinePlotItem(
+                pos=np.zeros((2, 3)), color=pg.mkColor("#a6e3a1"),
+                width=1.4, antialias=True, mode="line_strip")
+            s = 0.07
+            self._cube = gl.GLMeshItem(
+                meshdata=gl.MeshData(
+                    vertexes=np.array([[-s,-s,-s],[s,-s,-s],[s,s,-s],[-s,s,-s],
+                                       [-s,-s, s],[s,-s, s],[s,s, s],[-s,s, s]]),
+                    faces=np.array([[0,1,2],[0,2,3],[4,5,6],[4,6,7],
+                                    [0,1,5],[0,5,4],[2,3,7],[2,7,6],
+                                    [1,2,6],[1,6,5],[0,3,7],[0,7,4]])),
+                color=(0x94/255, 0xe2/255, 0xd5/255, 0.35), smooth=False,
+                drawEdges=True, edgeColor=pg.mkColor("#1e1e2e"),
+                glOptions="translucent")
+            self._gamma_tick = gl.GLLinePlotItem(
+                pos=np.zeros((2, 3)), color=pg.mkColor("#f5c2e7"),
+                width=2.2, antialias=True)
+            self._title = gl.GLTextItem(pos=(0.0, 0.0, ARM_LENGTH * 1.6),
+                                        color=pg.mkColor("#cdd6f4"))
+            for item in (self._link_line, self._alpha_arc, self._beta_arc,
+                         self._cube, self._gamma_tick, self._title):
+                self.addItem(item)
+
+            # line buffers refilled in place by arm_math.compute_arm_lines, as
+            # in ArmCanvas; pyqtgraph wants (N, 3) rows, so the kernel is
+            # handed transposed (3, N) views
+            self._t_unit = np.linspace(0.0, 1.0, 40)
+            self._end = np.empty(3)
+            self._R_ee = np.empty((3, 3))
+            self._link_pos = np.empty((2, 3))
+            self._alpha_pos = np.empty((40, 3))
+            self._beta_pos = np.empty((40, 3))
+            self._tick_pos = np.empty((2, 3))
+            self._model = np.eye(4)
+
+            self.update_arm(0, 0, 0)
+
+        def set_interactive(self, enabled: bool):
+            """Toggle mouse camera control (a disabled widget still renders)."""
+            self.setEnabled(enabled)
+
+        def update_arm(self, alpha_deg: float, beta_deg: float, gamma_deg: float):
+            # the cube is placed by its model transform, so no face vertices
+            compute_arm_lines(math.radians(alpha_deg), math.radians(beta_deg),
+                              math.radians(gamma_deg), ARM_LENGTH, self._t_unit,
+                              self._end, self._R_ee, self._link_pos.T,
+                              self._alpha_pos.T, self._beta_pos.T, self._tick_pos.T)
+
+            self._link_line.setData(pos=self._link_pos)
+            self._alpha_arc.setData(pos=self._alpha_pos)
+            self._alpha_arc.setVisible(abs(alpha_deg) > 0.5)
+            self._beta_arc.setData(pos=self._beta_pos)
+            self._beta_arc.setVisible(abs(beta_deg) > 0.5)
+
+            # cube pose as a single model transform
+            M = self._model
+            M[:3, :3] = self._R_ee
+            M[:3, 3] = self._end
+            self._cube.setTransform(pg.Transform3D(*M.ravel()))
+
+            self._gamma_tick.setData(pos=self._tick_pos)
+
+            self._title.setData(
+                text=f"α = {alpha_deg:.1f}°    β = {beta_deg:.1f}°    γ = {gamma_deg:.1f}°")
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -357,8 +582,10 @@ class ArmCanvas(FigureCanvasQTAgg):
 # ═════════════════════════════════════════════════════════════════════════════
 class _Signals(QObject):
     log       = pyqtSignal(str)
+    log_html  = pyqtSignal(str)
     set_pos   = pyqtSignal(float, float, float)
     seq_label = pyqtSignal(str)
+    progress  = pyqtSignal(int)
     seq_done  = pyqtSignal()
 
 
@@ -380,16 +607,34 @@ class RobotControlWindow(QMainWindow):
         self.cur_b = 0.0
         self.cur_g = 0.0
 
-        self.seq_data: list[dict] | None = None
+        self.seq_data: list[Step] | None = None
         self._seq_stop = threading.Event()
         self._seq_running = False
+        self._log_buf: collections.deque[tuple[str, str, bool]] = collections.deque(maxlen=5000)
+        self._log_pending = False
+        ts_fmt = QTextCharFormat()
+        ts_fmt.setForeground(QColor("#6c7086"))
+        self._log_fmts = (ts_fmt, QTextCharFormat())
         self._signals = _Signals()
-        self._signals.log.connect(self._append_log)
-        self._signals.set_pos.connect(self._sim_set)
+        self._signals.log.connect(self._log)
+        self._signals.log_html.connect(self._append_log)
+        self._signals.set_pos.connect(self._sim_set_and_pump)
+        self._last_pump = 0.0
         self._signals.seq_label.connect(lambda t: self.seq_lbl.setText(t))
         self._signals.seq_done.connect(self._on_seq_done)
 
+        self._pending_pos: tuple[float, float, float] | None = None
+        self._view_target = (0.0, 0.0, 0.0)
+        self._view_pending = False
+        self._rx_dispatch = {
+            "POS:": self._rx_pos,
+            "ACK:": self._rx_ack,
+            "ERR:": self._rx_err,
+            "DONE": self._rx_done,
+        }
+
         self._build_ui()
+        self._signals.progress.connect(self.seq_progress.setValue)
 
         # serial poll timer
         self._poll_timer = QTimer(self)
@@ -412,10 +657,14 @@ class RobotControlWindow(QMainWindow):
         plot_container = QWidget()
         plot_vbox = QVBoxLayout(plot_container)
         plot_vbox.setContentsMargins(0, 0, 0, 0)
-        self.canvas = ArmCanvas()
-        self.toolbar = NavigationToolbar2QT(self.canvas, plot_container)
-        self.toolbar.setStyleSheet("background: #181825; border: none;")
-        plot_vbox.addWidget(self.toolbar)
+        if gl is not None:
+            self.canvas = GLArmView()
+            self.toolbar = None
+        else:
+            self.canvas = ArmCanvas()
+            self.toolbar = NavigationToolbar2QT(self.canvas, plot_container)
+            self.toolbar.setStyleSheet("background: #181825; border: none;")
+            plot_vbox.addWidget(self.toolbar)
         plot_vbox.addWidget(self.canvas, stretch=1)
         splitter.addWidget(plot_container)
 
@@ -540,6 +789,7 @@ class RobotControlWindow(QMainWindow):
         log_layout = QVBoxLayout(log_grp)
         self.log_box = QTextEdit()
         self.log_box.setReadOnly(True)
+        self.log_box.document().setMaximumBlockCount(2000)
         log_layout.addWidget(self.log_box)
         ctrl_layout.addWidget(log_grp, stretch=1)
 
@@ -576,9 +826,17 @@ class RobotControlWindow(QMainWindow):
         slider.setValue(0)
         row.addWidget(slider, stretch=1)
 
-        # bidirectional sync
-        spin.valueChanged.connect(lambda v: slider.setValue(int(v * 10)))
-        slider.valueChanged.connect(lambda v: spin.setValue(v / 10.0))
+        # bidirectional sync; the mirrored set must not echo back
+        def _on_spin(v: float):
+            with QSignalBlocker(slider):
+                slider.setValue(int(v * 10))
+
+        def _on_slider(v: int):
+            with QSignalBlocker(spin):
+                spin.setValue(v / 10.0)
+
+        spin.valueChanged.connect(_on_spin)
+        slider.valueChanged.connect(_on_slider)
 
         layout.addLayout(row)
         return spin, slider
@@ -590,8 +848,48 @@ class RobotControlWindow(QMainWindow):
         self.port_cb.addItems(ports)
 
     # ── logging ───────────────────────────────────────────────────────────
+    def _log(self, msg: str):
+        """Log plain text (no rich-text parsing); used for the high-volume lines."""
+        self._queue_log(msg, False)
+
     def _append_log(self, msg: str):
-        self.log_box.append(f"<span style='color:#6c7086'>[{time.strftime('%H:%M:%S')}]</span> {msg}")
+        """Log a line containing HTML markup."""
+        self._queue_log(msg, True)
+
+    def _queue_log(self, msg: str, html: bool):
+        # buffered; lines reach the widget in one batch per _flush_log
+        self._log_buf.append((time.strftime("[%H:%M:%S]"), msg, html))
+        if not self._log_pending:
+            self._log_pending = True
+            QTimer.singleShot(30, self._flush_log)
+
+    def _flush_log(self):
+        self._log_pending = False
+        if not self._log_buf:
+            return
+        lines = list(self._log_buf)
+        self._log_buf.clear()
+
+        bar = self.log_box.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+        doc = self.log_box.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        ts_fmt, plain_fmt = self._log_fmts
+        cursor.beginEditBlock()
+        for i, (ts, msg, html) in enumerate(lines):
+            # one block per line so setMaximumBlockCount trims whole lines
+            if i or not doc.isEmpty():
+                cursor.insertBlock(doc.lastBlock().blockFormat(), plain_fmt)
+            cursor.insertText(ts, ts_fmt)
+            cursor.insertText(" ", plain_fmt)
+            if html:
+                cursor.insertHtml(msg)
+            else:
+                cursor.insertText(msg, plain_fmt)
+        cursor.endEditBlock()
+        if at_bottom:
+            bar.setValue(bar.maximum())
 
     def _update_pos_labels(self):
         self.pos_labels["α"].setText(f"{self.cur_a:>8.2f}°")
@@ -610,7 +908,7 @@ class RobotControlWindow(QMainWindow):
                 "background: #fab387; color: #1e1e2e; font-weight: bold; "
                 "padding: 2px 8px; border-radius: 3px;")
             self.status.showMessage("Disconnected — simulation mode")
-            self._append_log("Disconnected")
+            self._log("Disconnected")
         else:
             port = self.port_cb.currentText()
             if not port:
@@ -626,17 +924,19 @@ class RobotControlWindow(QMainWindow):
                     "background: #a6e3a1; color: #1e1e2e; font-weight: bold; "
                     "padding: 2px 8px; border-radius: 3px;")
                 self.status.showMessage(f"Connected to {port} @ 115200")
-                self._append_log(f"Connected to {port} @ 115200")
+                self._log(f"Connected to {port} @ 115200")
             except serial.SerialException as e:
                 QMessageBox.critical(self, "Connection Error", str(e))
-                self._append_log(f"Connection failed: {e}")
+                self._log(f"Connection failed: {e}")
 
     # ── manual commands ───────────────────────────────────────────────────
     @staticmethod
     def _clamp(a, b, g):
-        return (float(np.clip(a, ALPHA_MIN, ALPHA_MAX)),
-                float(np.clip(b, BETA_MIN,  BETA_MAX)),
-                float(np.clip(g, GAMMA_MIN, GAMMA_MAX)))
+        # plain comparisons: far cheaper than np.clip on single scalars
+        a, b, g = float(a), float(b), float(g)
+        return (ALPHA_MIN if a < ALPHA_MIN else ALPHA_MAX if a > ALPHA_MAX else a,
+                BETA_MIN  if b < BETA_MIN  else BETA_MAX  if b > BETA_MAX  else b,
+                GAMMA_MIN if g < GAMMA_MIN else GAMMA_MAX if g > GAMMA_MAX else g)
 
     def _read_spins(self):
         return self.spin_a.value(), self.spin_b.value(), self.spin_g.value()
@@ -646,7 +946,7 @@ class RobotControlWindow(QMainWindow):
         spd = self.speed_spin.value()
         if self.serial.connected:
             self.serial.send_move_abs(a, b, g, spd)
-            self._append_log(f"TX MOVE_ABS  α={a:.1f}  β={b:.1f}  γ={g:.1f}  spd={spd:.0f}")
+            self._log(f"TX MOVE_ABS  α={a:.1f}  β={b:.1f}  γ={g:.1f}  spd={spd:.0f}")
         else:
             self._sim_set(a, b, g)
             self._append_log(f"<b>[SIM]</b> ABS  α={a:.1f}  β={b:.1f}  γ={g:.1f}")
@@ -656,7 +956,7 @@ class RobotControlWindow(QMainWindow):
         spd = self.speed_spin.value()
         if self.serial.connected:
             self.serial.send_move_rel(da, db, dg, spd)
-            self._append_log(f"TX MOVE_REL  Δα={da:.1f}  Δβ={db:.1f}  Δγ={dg:.1f}  spd={spd:.0f}")
+            self._log(f"TX MOVE_REL  Δα={da:.1f}  Δβ={db:.1f}  Δγ={dg:.1f}  spd={spd:.0f}")
         else:
             a, b, g = self._clamp(self.cur_a + da, self.cur_b + db, self.cur_g + dg)
             self._sim_set(a, b, g)
@@ -664,13 +964,40 @@ class RobotControlWindow(QMainWindow):
 
     def _cmd_preview(self):
         a, b, g = self._clamp(*self._read_spins())
-        self.canvas.update_arm(a, b, g)
-        self._append_log(f"Preview  α={a:.1f}  β={b:.1f}  γ={g:.1f}")
+        self._request_view(a, b, g)
+        self._log(f"Preview  α={a:.1f}  β={b:.1f}  γ={g:.1f}")
 
     def _sim_set(self, a: float, b: float, g: float):
         self.cur_a, self.cur_b, self.cur_g = a, b, g
         self._update_pos_labels()
-        self.canvas.update_arm(a, b, g)
+        self._request_view(a, b, g)
+
+    def _sim_set_and_pump(self, a: float, b: float, g: float):
+        # slot for the sequence worker's set_pos (runs on the GUI thread):
+        # let pending paint/timer events through, at most every 50 ms, so
+        # long simulated sequences keep redrawing
+        self._sim_set(a, b, g)
+        now = time.monotonic()
+        if now - self._last_pump > 0.05:
+            self._last_pump = now
+            QApplication.processEvents(
+                QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents, 5)
+
+    def _request_view(self, a: float, b: float, g: float):
+        # repeated / jittering reports of a held pose don't need a redraw
+        ta, tb, tg = self._view_target
+        if abs(a - ta) < VIEW_EPS_DEG and abs(b - tb) < VIEW_EPS_DEG \
+                and abs(g - tg) < VIEW_EPS_DEG:
+            return
+        # bursts of pose changes collapse into one redraw of the latest pose
+        self._view_target = (a, b, g)
+        if not self._view_pending:
+            self._view_pending = True
+            QTimer.singleShot(30, self._flush_view)
+
+    def _flush_view(self):
+        self._view_pending = False
+        self.canvas.update_arm(*self._view_target)
 
     # ── E-stop / Home ─────────────────────────────────────────────────────
     def _estop(self):
@@ -683,7 +1010,7 @@ class RobotControlWindow(QMainWindow):
         spd = self.speed_spin.value()
         if self.serial.connected:
             self.serial.send_home(spd)
-            self._append_log(f"TX HOME  spd={spd:.0f}")
+            self._log(f"TX HOME  spd={spd:.0f}")
         else:
             self._sim_set(0, 0, 0)
             self.spin_a.setValue(0); self.spin_b.setValue(0); self.spin_g.setValue(0)
@@ -701,20 +1028,14 @@ class RobotControlWindow(QMainWindow):
                 data = json.load(f)
             if not isinstance(data, list):
                 raise ValueError("Root must be a JSON array of commands")
-            valid = {"move_abs", "move_rel", "delay", "home"}
-            for i, c in enumerate(data):
-                if "command" not in c:
-                    raise ValueError(f"Step {i+1}: missing 'command' key")
-                if c["command"] not in valid:
-                    raise ValueError(f"Step {i+1}: unknown command '{c['command']}'")
-            self.seq_data = data
+            self.seq_data = [parse_step(i, c) for i, c in enumerate(data)]
             name = os.path.basename(path)
             self.seq_lbl.setText(f"{len(data)} steps — {name}")
             self.run_btn.setEnabled(True)
-            self._append_log(f"Loaded {len(data)} steps from {name}")
+            self._log(f"Loaded {len(data)} steps from {name}")
         except (json.JSONDecodeError, ValueError, OSError) as e:
             QMessageBox.critical(self, "Sequence Error", str(e))
-            self._append_log(f"Load error: {e}")
+            self._log(f"Load error: {e}")
 
     def _run_seq(self):
         if not self.seq_data or self._seq_running:
@@ -726,6 +1047,7 @@ class RobotControlWindow(QMainWindow):
         self.seq_progress.setRange(0, len(self.seq_data))
         self.seq_progress.setValue(0)
         self.seq_progress.setVisible(True)
+        self._set_live(True)
         threading.Thread(target=self._seq_worker, daemon=True).start()
 
     def _stop_seq(self):
@@ -737,37 +1059,43 @@ class RobotControlWindow(QMainWindow):
         self.run_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.seq_progress.setVisible(False)
+        self._set_live(False)
+
+    def _set_live(self, live: bool):
+        # no view navigation while a sequence streams poses into the view
+        if self.toolbar is not None:
+            self.toolbar.setVisible(not live)
+        self.canvas.set_interactive(not live)
 
     def _seq_worker(self):
         sig = self._signals
+        n_steps = len(self.seq_data)
+        last_prog = 0.0
         try:
             for i, step in enumerate(self.seq_data):
                 if self._seq_stop.is_set():
                     sig.log.emit("Sequence aborted")
                     break
 
-                cmd = step["command"]
-                sig.seq_label.emit(f"Running {i+1}/{len(self.seq_data)}  ({cmd})")
+                kind = step.kind
+                sig.seq_label.emit(f"Running {i+1}/{n_steps}  ({STEP_NAMES[kind]})")
 
-                if cmd == "move_abs":
-                    a = step.get("alpha", self.cur_a)
-                    b = step.get("beta",  self.cur_b)
-                    g = step.get("gamma", self.cur_g)
-                    spd = step.get("speed", 30.0)
-                    a, b, g = self._clamp(a, b, g)
+                if kind == STEP_MOVE_ABS:
+                    a, b, g, spd = step.a, step.b, step.g, step.spd
+                    # NaN (omitted in the step) keeps the current axis
+                    a, b, g = self._clamp(self.cur_a if math.isnan(a) else a,
+                                          self.cur_b if math.isnan(b) else b,
+                                          self.cur_g if math.isnan(g) else g)
                     if self.serial.connected:
                         self.serial.send_move_abs(a, b, g, spd)
                         self._wait_done()
                     else:
                         sig.set_pos.emit(a, b, g)
-                        time.sleep(0.3)
+                        self._seq_stop.wait(0.3)   # returns early on Stop
                     sig.log.emit(f"SEQ ABS  α={a:.1f} β={b:.1f} γ={g:.1f} spd={spd:.0f}")
 
-                elif cmd == "move_rel":
-                    da = step.get("alpha", 0.0)
-                    db = step.get("beta",  0.0)
-                    dg = step.get("gamma", 0.0)
-                    spd = step.get("speed", 30.0)
+                elif kind == STEP_MOVE_REL:
+                    da, db, dg, spd = step.a, step.b, step.g, step.spd
                     if self.serial.connected:
                         self.serial.send_move_rel(da, db, dg, spd)
                         self._wait_done()
@@ -775,30 +1103,33 @@ class RobotControlWindow(QMainWindow):
                         a, b, g = self._clamp(self.cur_a + da, self.cur_b + db,
                                               self.cur_g + dg)
                         sig.set_pos.emit(a, b, g)
-                        time.sleep(0.3)
+                        self._seq_stop.wait(0.3)   # returns early on Stop
                     sig.log.emit(f"SEQ REL  Δα={da:.1f} Δβ={db:.1f} Δγ={dg:.1f} spd={spd:.0f}")
 
-                elif cmd == "delay":
-                    t = step.get("time", 1.0)
+                elif kind == STEP_DELAY:
+                    t = step.t
                     sig.log.emit(f"SEQ DELAY {t:.2f}s")
-                    deadline = time.time() + t
-                    while time.time() < deadline and not self._seq_stop.is_set():
-                        time.sleep(0.05)
+                    if self._seq_stop.wait(t):
+                        sig.log.emit("Sequence aborted")
+                        break
 
-                elif cmd == "home":
-                    spd = step.get("speed", 30.0)
+                elif kind == STEP_HOME:
+                    spd = step.spd
                     if self.serial.connected:
                         self.serial.send_home(spd)
                         self._wait_done()
                     else:
                         sig.set_pos.emit(0.0, 0.0, 0.0)
-                        time.sleep(0.3)
+                        self._seq_stop.wait(0.3)   # returns early on Stop
                     sig.log.emit(f"SEQ HOME  spd={spd:.0f}")
 
-                # update progress bar in main thread is safe via signal
-                self.seq_progress.setValue(i + 1)   # works cross-thread for QProgressBar
+                # progress bar is updated on the GUI thread, at most ~20 Hz
+                now = time.monotonic()
+                if now - last_prog >= 0.05 or i + 1 == n_steps:
+                    sig.progress.emit(i + 1)
+                    last_prog = now
             else:
-                sig.log.emit("<b>Sequence complete ✓</b>")
+                sig.log_html.emit("<b>Sequence complete ✓</b>")
                 sig.seq_label.emit("Sequence complete")
         except Exception as exc:
             sig.log.emit(f"Sequence error: {exc}")
@@ -806,41 +1137,61 @@ class RobotControlWindow(QMainWindow):
             sig.seq_done.emit()
 
     def _wait_done(self, timeout: float = 60.0) -> bool:
-        t0 = time.time()
-        while time.time() - t0 < timeout and not self._seq_stop.is_set():
-            for msg in self.serial.drain():
-                self._signals.log.emit(f"RX {msg}")
-                if msg.strip() == "DONE":
-                    return True
-            time.sleep(0.05)
+        # woken by the reader thread; RX lines themselves are still handled
+        # (and logged) by _poll_serial on the GUI thread
+        deadline = time.monotonic() + timeout
+        while not self._seq_stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self.serial.wait_done(min(remaining, 0.1)):
+                return True
         return False
 
     # ── serial polling ────────────────────────────────────────────────────
     def _poll_serial(self):
         if not self.serial.connected:
             return
-        for msg in self.serial.drain():
-            self._handle_rx(msg)
+        msgs = self.serial.drain()
+        if not msgs:
+            return
+        handle = self._handle_rx
+        for msg in msgs:
+            handle(msg)
+        # POS lines only record the pose; draw the newest one once per tick
+        pos = self._pending_pos
+        if pos is not None:
+            self._pending_pos = None
+            self.cur_a, self.cur_b, self.cur_g = pos
+            self._update_pos_labels()
+            self._request_view(*pos)
 
     def _handle_rx(self, msg: str):
-        if msg.startswith("POS:"):
-            try:
-                parts = msg[4:].split(",")
-                self.cur_a = float(parts[0])
-                self.cur_b = float(parts[1])
-                self.cur_g = float(parts[2])
-                self._update_pos_labels()
-                self.canvas.update_arm(self.cur_a, self.cur_b, self.cur_g)
-            except (ValueError, IndexError):
-                self._append_log(f"Bad POS msg: {msg}")
-        elif msg.startswith("ACK:"):
-            self._append_log(f"RX {msg}")
-        elif msg.startswith("ERR:"):
-            self._append_log(f"<span style='color:#f38ba8'>⚠ {msg}</span>")
-        elif msg.strip() == "DONE":
-            self._append_log("RX DONE")
+        # one partition + dict lookup instead of a startswith cascade;
+        # the key keeps the ':' so "DONE" and "POS:" stay distinct
+        head, sep, body = msg.partition(":")
+        handler = self._rx_dispatch.get(head + sep)
+        if handler is None:
+            self._log(f"RX? {msg}")
         else:
-            self._append_log(f"RX? {msg}")
+            handler(msg, body)
+
+    def _rx_pos(self, msg: str, body: str):
+        try:
+            a, b, g = map(float, body.split(",")[:3])
+        except ValueError:
+            self._log(f"Bad POS msg: {msg}")
+            return
+        self._pending_pos = (a, b, g)      # applied by _poll_serial
+
+    def _rx_ack(self, msg: str, body: str):
+        self._log(f"RX {msg}")
+
+    def _rx_err(self, msg: str, body: str):
+        self._append_log(f"<span style='color:#f38ba8'>⚠ {msg}</span>")
+
+    def _rx_done(self, msg: str, body: str):
+        self._log("RX DONE")
 
     # ── cleanup ───────────────────────────────────────────────────────────
     def closeEvent(self, event):
@@ -20,9 +20,13 @@ Usage:
     Single axis:  A,B,Index,Angle          e.g.  1,0,0,45.2310
     Dual axis:    A1,B1,A2,B2,Index,Angle1,Angle2
 
+  Script mode runs quad_out_script1.py --binary and reads its records (see PACKET).
+
   Dependencies:
-    pip install pyserial
+    pip install numpy pyserial
 """
+import selectors
+import struct
 import subprocess
 import threading
 import tkinter as tk
@@ -32,6 +36,8 @@ import os
 import tempfile
 import time
 
+import numpy as np
+
 
 SCRIPT           = 'quad_out_script1.py'
 SAMPLES          = 150
@@ -40,10 +46,19 @@ CPR              = 4096
 ANGLE_RESOLUTION = 360.0 / (4 * CPR)
 LABEL_BAR_H      = 40
 POLL_INTERVAL    = 20    # ms — file polling interval (live mode only)
+SCRIPT_POLL      = 5     # ms — producer pipe polling interval (script mode, POSIX)
+MIN_FRAME_TIME   = 0.016 # s — minimum spacing between waveform repaints
 DEFAULT_BAUD     = 115200
 
 LIVE_DATA_FILE = os.path.join(tempfile.gettempdir(), 'quad_live_angles.txt')
 
+# Script-mode record: NumAxes, A1, B1, A2, B2, Index, Angle1, Angle2
+# Must match RECORD in quad_out_script1.py
+PACKET = struct.Struct('<6B2f')
+
+# Bit of a packed (A << 1) | B ring sample for the A and B rows
+_AB_SHIFT = np.array([[1], [0]], dtype=np.uint8)
+
 
 # ---------------------------------------------------------------------------
 # Quadrature helpers — matched to quad_out_script1.py
@@ -62,6 +77,29 @@ def angle_to_quadrature(angle_deg: float) -> tuple[int, int]:
     return quadrature_pattern_from_angle(quantize_angle_to_cpr(angle_deg) % 360.0)
 
 
+def parse_csv_line(line: str) -> tuple | None:
+    """Parse an ESP32 CSV line into a PACKET-shaped sample tuple.
+
+    Accepts the full quadrature CSV format:
+      single: A,B,Index,Angle
+      dual:   A1,B1,A2,B2,Index,Angle1,Angle2
+    Returns (num_axes, a1, b1, a2, b2, index, angle1, angle2), or None if
+    the line is malformed. Safe to call from any thread.
+    """
+    parts = line.split(',')
+    try:
+        if len(parts) == 4:
+            a1, b1, idx = map(int, parts[:3])
+            return (1, a1, b1, 0, 0, idx, float(parts[3]), 0.0)
+        if len(parts) == 7:
+            a1, b1, a2, b2, idx = map(int, parts[:5])
+            angle1, angle2 = map(float, parts[5:])
+            return (2, a1, b1, a2, b2, idx, angle1, angle2)
+    except ValueError:
+        pass
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Main display
 # ---------------------------------------------------------------------------
@@ -95,6 +133,10 @@ class LiveDisplay(tk.Tk):
 
         self.canvas = tk.Canvas(self, width=self.canvas_w, height=self.canvas_h, bg='white')
         self.canvas.pack(fill='none', expand=False, padx=8, pady=(8, 0))
+        # highlight ring + border on each side; <Configure> sizes include them
+        self._canvas_border = 2 * (int(self.canvas.cget('highlightthickness'))
+                                   + int(self.canvas.cget('borderwidth')))
+        self.canvas.bind('<Configure>', self._on_resize)
 
         self.angle_frame = tk.Frame(self, height=LABEL_BAR_H)
         self.angle_frame.pack(fill='x', padx=8, pady=(0, 8))
@@ -111,22 +153,28 @@ class LiveDisplay(tk.Tk):
         self.update_idletasks()
         self.geometry(f'{self.canvas_w + 16}x{self.canvas_h + LABEL_BAR_H + 24}')
 
-        self.a1_buf = deque([0] * SAMPLES, maxlen=SAMPLES)
-        self.b1_buf = deque([0] * SAMPLES, maxlen=SAMPLES)
-        self.a2_buf = deque([0] * SAMPLES, maxlen=SAMPLES)
-        self.b2_buf = deque([0] * SAMPLES, maxlen=SAMPLES)
+        # Sample history as a ring, one row per axis holding (A << 1) | B;
+        # column _write_idx is the oldest sample (next to be overwritten).
+        # Every sample is stored twice, SAMPLES apart, so the history in
+        # order is always the contiguous view [_write_idx:_write_idx + SAMPLES].
+        self._ring = np.zeros((2, 2 * SAMPLES), dtype=np.uint8)
+        self._write_idx = 0
 
         self.index   = 0
+        self.angle1  = self.angle2 = None   # latest angles, shown by _draw_frame
+        self._label_text = [None, None]     # text last set on angle1/2_label
         self.running = True
+        self._layout = None     # (canvas_w, canvas_h, num_axes) the items were built for
+        self._dirty  = True     # samples or layout changed since the last frame
+        self._last_frame = 0.0
         self.proc    = None
 
-        # Pending updates written by BT thread, drained on main thread
-        self._pending = []
-        self._pending_lock = threading.Lock()
+        # Decoded samples from the reader threads / file poll. Single
+        # consumer (redraw); deque append/popleft are atomic, so no lock.
+        self._inq = deque(maxlen=4096)
 
         if self.bt_port:
             self._start_bt_reader()
-            self.after(POLL_INTERVAL, self._drain_pending)
         elif self.live_mode:
             self._init_live_file()
             self.after(POLL_INTERVAL, self._poll_live_file)
@@ -136,47 +184,33 @@ class LiveDisplay(tk.Tk):
         self.after(REDRAW_TIME, self.redraw)
 
     # ------------------------------------------------------------------
-    # Shared: apply one parsed CSV line to buffers/labels.
-    # Must be called on the main thread.
-    # Accepts the full quadrature CSV format from the ESP32:
-    #   single: A,B,Index,Angle
-    #   dual:   A1,B1,A2,B2,Index,Angle1,Angle2
+    # Shared: every input mode pushes sample tuples (see PACKET /
+    # parse_csv_line) onto self._inq; redraw() drains it on the main thread.
     # ------------------------------------------------------------------
 
-    def _apply_line(self, line: str):
-        parts = line.split(',')
-        # Auto-detect axis count
-        if len(parts) == 4:
-            self.num_axes = 1
-        elif len(parts) == 7:
-            self.num_axes = 2
-        else:
-            return
-
-        try:
-            if self.num_axes == 1:
-                a1, b1  = int(parts[0]), int(parts[1])
-                idx     = int(parts[2])
-                angle1  = float(parts[3])
-                self.a1_buf.append(a1)
-                self.b1_buf.append(b1)
-                self.index = idx
-                self.angle1_label.config(text=f'Axis1: {angle1:.3f}°')
-
-            else:
-                a1, b1  = int(parts[0]), int(parts[1])
-                a2, b2  = int(parts[2]), int(parts[3])
-                idx     = int(parts[4])
-                angle1  = float(parts[5])
-                angle2  = float(parts[6])
-                self.a1_buf.append(a1); self.b1_buf.append(b1)
-                self.a2_buf.append(a2); self.b2_buf.append(b2)
-                self.index = idx
-                self.angle1_label.config(text=f'Axis1: {angle1:.3f}°')
-                self.angle2_label.config(text=f'Axis2: {angle2:.3f}°')
-
-        except (ValueError, IndexError):
-            pass
+    def _apply_records(self, records: list):
+        """Apply decoded sample tuples; must be called on the main thread.
+
+        Only the last record's index/angles are kept for display.
+        """
+        n = min(len(records), SAMPLES)
+        # CSV input is unchecked: treat any nonzero A/B as high, like a
+        # truthiness test, so out-of-range values can't overflow uint8
+        vals = np.array([r[1:5] for r in records[-n:]], dtype=bool).astype(np.uint8)  # (n, 4)
+        cols = (self._write_idx + np.arange(n)) % SAMPLES
+        # levels are exactly 0/1 here, so A and B each stay in their own bit
+        packed = ((vals[:, 0::2] << 1) | vals[:, 1::2]).T
+        self._ring[:, cols] = packed
+        self._ring[:, cols + SAMPLES] = packed
+        self._write_idx = (self._write_idx + n) % SAMPLES
+        self._dirty = True
+
+        num_axes, _, _, _, _, idx, angle1, angle2 = records[-1]
+        self.num_axes = 2 if num_axes == 2 else 1
+        self.index = idx
+        self.angle1 = angle1
+        if num_axes == 2:
+            self.angle2 = angle2
 
     # ------------------------------------------------------------------
     # Mode A: subprocess script
@@ -185,25 +219,54 @@ class LiveDisplay(tk.Tk):
     def _start_script(self):
         try:
             self.proc = subprocess.Popen(
-                [sys.executable, SCRIPT],
+                [sys.executable, SCRIPT, '--binary'],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                text=True,
+                bufsize=-1,
             )
         except Exception as e:
             tk.messagebox.showerror('Error', f'Failed to start {SCRIPT}: {e}')
             self.destroy()
             return
 
-        def reader():
-            for raw in self.proc.stdout:
-                if not self.running:
-                    break
-                line = raw.strip()
-                if line:
-                    self.after(0, self._apply_line, line)
-
-        threading.Thread(target=reader, daemon=True).start()
+        self._script_buf = bytearray()
+        if sys.platform == 'win32':
+            # select() only works on sockets on Windows; block on a thread
+            threading.Thread(target=self._script_reader, daemon=True).start()
+        else:
+            self._sel = selectors.DefaultSelector()
+            self._sel.register(self.proc.stdout, selectors.EVENT_READ)
+            self.after(SCRIPT_POLL, self._pump_script)
+
+    def _feed_script(self, chunk: bytes):
+        # Binary records: decode every complete record at once, keep the
+        # partial tail for next time
+        buf = self._script_buf
+        buf += chunk
+        n = len(buf) - len(buf) % PACKET.size
+        if n:
+            self._inq.extend(PACKET.iter_unpack(buf[:n]))
+            del buf[:n]
+
+    def _script_reader(self):
+        stdout = self.proc.stdout
+        while self.running:
+            chunk = stdout.read1(4096)
+            if not chunk:
+                break               # producer exited
+            self._feed_script(chunk)
+
+    def _pump_script(self):
+        """Read the producer pipe from the Tk loop while it is readable."""
+        fd = self.proc.stdout.fileno()
+        while self._sel.select(timeout=0):
+            chunk = os.read(fd, 8192)   # raw fd: nothing left buffered behind select
+            if not chunk:
+                self._sel.close()       # producer exited
+                return
+            self._feed_script(chunk)
+        if self.running:
+            self.after(SCRIPT_POLL, self._pump_script)
 
     # ------------------------------------------------------------------
     # Mode B: live temp file polling
@@ -222,9 +285,9 @@ class LiveDisplay(tk.Tk):
                 chunk = f.read()
                 self._live_offset = f.tell()
             for raw in chunk.splitlines():
-                line = raw.strip()
-                if line:
-                    self._apply_line(line)
+                sample = parse_csv_line(raw.strip())
+                if sample is not None:
+                    self._inq.append(sample)
         except Exception:
             pass
         if self.running:
@@ -236,9 +299,8 @@ class LiveDisplay(tk.Tk):
     # The ESP32 paired over Classic BT appears as a COM port on Windows.
     # pyserial reads it like any serial device — no special BT library needed.
     #
-    # The serial read runs in a background thread (readline() blocks).
-    # Parsed lines are batched into self._pending under a lock.
-    # _drain_pending() runs on the main thread via after() and applies them.
+    # The serial read runs in a background thread (read() blocks up to the
+    # timeout). Complete lines are parsed there and queued on self._inq.
     # ------------------------------------------------------------------
 
     def _start_bt_reader(self):
@@ -264,18 +326,23 @@ class LiveDisplay(tk.Tk):
                         timeout=2,          # 2 s read timeout so thread can check self.running
                     )
                     print(f'[bt] connected.')
+                    buf = bytearray()
                     while self.running:
-                        raw = ser.readline()
-                        if not raw:
+                        # everything already received, or block for one byte
+                        chunk = ser.read(ser.in_waiting or 1)
+                        if not chunk:
                             continue        # timeout — loop back and check self.running
-                        try:
-                            line = raw.decode('utf-8', errors='replace').strip()
-                        except Exception:
-                            continue
-                        if not line:
-                            continue
-                        with self._pending_lock:
-                            self._pending.append(line)
+                        buf += chunk
+                        nl = buf.rfind(b'\n')
+                        if nl < 0:
+                            continue        # no complete line yet
+                        # split every complete line at once; keep the partial tail
+                        text = buf[:nl].decode('utf-8', errors='replace')
+                        del buf[:nl + 1]
+                        for ln in text.split('\n'):
+                            sample = parse_csv_line(ln.rstrip('\r'))
+                            if sample is not None:
+                                self._inq.append(sample)
 
                 except Exception as e:
                     print(f'[bt] error: {e} — retrying in 2 s')
@@ -298,61 +365,127 @@ class LiveDisplay(tk.Tk):
 
         threading.Thread(target=reader, daemon=True).start()
 
-    def _drain_pending(self):
-        """Drain BT lines onto the main thread and apply to buffers."""
-        with self._pending_lock:
-            lines, self._pending = self._pending, []
-        for line in lines:
-            self._apply_line(line)
-        if self.running:
-            self.after(POLL_INTERVAL, self._drain_pending)
-
     # ------------------------------------------------------------------
     # Rendering
     # ------------------------------------------------------------------
 
-    def redraw(self):
+    def _on_resize(self, event):
+        """Track the drawable canvas size; redraw rebuilds the layout if it changed."""
+        self.canvas_w = max(1, event.width - self._canvas_border)
+        self.canvas_h = max(1, event.height - self._canvas_border)
+
+    def _build_items(self):
+        """(Re)create the persistent canvas items for the current layout."""
         self.canvas.delete('all')
 
         num_rows = self.num_axes * 2
         row_h = max(40, self.canvas_h // num_rows)
-        col_w = max(1,  self.canvas_w // SAMPLES)
+        labels = ['A1', 'B1', 'A2', 'B2'][:num_rows]
 
-        buffers = [(self.a1_buf, 'A1'), (self.b1_buf, 'B1')]
-        if self.num_axes == 2:
-            buffers.extend([(self.a2_buf, 'A2'), (self.b2_buf, 'B2')])
-
-        for i, (buf, label) in enumerate(buffers):
+        row_y = []                # (y_high, y_low) per row
+        self._row_lines = []      # waveform line item per row
+        for i, label in enumerate(labels):
             y0     = i * row_h
             y_high = y0 + 10
             y_low  = y0 + row_h - 10
+            row_y.append((y_high, y_low))
 
             self.canvas.create_text(8, (y_high + y_low) / 2, anchor='w',
                                     text=label, font=('Consolas', 16))
-
-            snapshot = list(buf)
-            coords = []
-            x = self.canvas_w - col_w * len(snapshot)
-            for v in snapshot:
-                y = y_high if v else y_low
-                coords.extend([x, y])
-                x += col_w
-
-            if len(coords) >= 4:
-                self.canvas.create_line(coords, fill='blue', width=2, smooth=False)
-
+            self._row_lines.append(
+                self.canvas.create_line(0, y_low, 0, y_low, fill='blue', width=2,
+                                        smooth=False))
             self.canvas.create_line(60, y0 + row_h, self.canvas_w, y0 + row_h,
                                     fill='black', width=1)
 
         # Index indicator
-        idx_color = 'red' if self.index else 'lightgrey'
-        self.canvas.create_oval(self.canvas_w - 36, 6, self.canvas_w - 10, 30,
-                                fill=idx_color, outline='black')
+        self._idx_color = 'lightgrey'
+        self._idx_oval = self.canvas.create_oval(
+            self.canvas_w - 36, 6, self.canvas_w - 10, 30,
+            fill=self._idx_color, outline='black')
         self.canvas.create_text(self.canvas_w - 60, 18, text='INDEX', font=('Consolas', 10))
 
+        # left edge of each sample column, plus the right end of the last
+        col_w = max(1, self.canvas_w // SAMPLES)
+        x0 = self.canvas_w - col_w * SAMPLES
+        self._xs = x0 + col_w * np.arange(SAMPLES + 1)
+        row_y = np.array(row_y)
+        self._y_high = row_y[:, :1]
+        self._y_low = row_y[:, 1:]
+        self._drawn_y = np.full((num_rows, SAMPLES), -1, dtype=np.int64)
+
+        # raw Tcl command for coords updates, skipping Tkinter's argument _flatten
+        self._tkcall = self.canvas.tk.call
+        self._canvas_path = self.canvas._w
+
+        self._layout = (self.canvas_w, self.canvas_h, self.num_axes)
+        self._dirty = True
+
+    def _drain_input(self):
+        inq = self._inq
+        if not inq:
+            return
+        records = []
+        try:
+            while True:
+                records.append(inq.popleft())
+        except IndexError:
+            pass
+        self._apply_records(records)
+
+    def redraw(self):
+        self._drain_input()
+
+        # items are created once per layout and only moved afterwards
+        if self._layout != (self.canvas_w, self.canvas_h, self.num_axes):
+            self._build_items()
+
+        # repaint only when something changed, and no faster than MIN_FRAME_TIME
+        now = time.monotonic()
+        if self._dirty and now - self._last_frame >= MIN_FRAME_TIME:
+            self._dirty = False
+            self._last_frame = now
+            self._draw_frame()
+
         if self.running:
             self.after(REDRAW_TIME, self.redraw)
 
+    def _draw_frame(self):
+        # view the ring oldest -> newest, split each axis into its A and B
+        # rows, then map 1/0 to y_high/y_low
+        k = self._write_idx
+        snap = self._ring[:self.num_axes, k:k + SAMPLES]
+        bits = ((snap[:, None, :] >> _AB_SHIFT) & 1).reshape(-1, SAMPLES)
+        ys = np.where(bits, self._y_high, self._y_low)
+
+        # only rows whose trace moved cost a Tcl round trip
+        changed = (ys != self._drawn_y).any(axis=1)
+        self._drawn_y[changed] = ys[changed]
+        tkcall, path, xs = self._tkcall, self._canvas_path, self._xs
+        for line_id, y in zip(np.compress(changed, self._row_lines), ys[changed]):
+            # step function: a vertex pair at each level change, plus the ends
+            edges = np.flatnonzero(y[1:] != y[:-1]) + 1
+            px = np.concatenate((xs[:1], np.repeat(xs[edges], 2), xs[-1:]))
+            py = np.concatenate((y[:1], np.column_stack((y[edges - 1], y[edges])).ravel(),
+                                 y[-1:]))
+            tkcall(path, 'coords', int(line_id), *np.column_stack((px, py)).ravel().tolist())
+
+        idx_color = 'red' if self.index else 'lightgrey'
+        if idx_color != self._idx_color:
+            self._idx_color = idx_color
+            self.canvas.itemconfig(self._idx_oval, fill=idx_color)
+
+        # labels are reconfigured only when their formatted text changes
+        for i, (label, name, angle) in enumerate(
+                ((self.angle1_label, 'Axis1', self.angle1),
+                 (self.angle2_label, 'Axis2', self.angle2))):
+            if angle is None:
+                continue
+            text = f'{name}: {angle:.3f}°'
+            if text != self._label_text[i]:
+                self._label_text[i] = text
+                label.config(text=text)
+
     def on_close(self):
         self.running = False
         try:
@@ -5,68 +5,155 @@ This is a simple testing script that emits simulated quadrature output and angle
 Can be used along with `output_display.py` to visualize the output, or simply on its own to verify the 
 quadrature signal generation and performance of the system under different angle inputs.
 Configuration: set NUM_AXES to 1 or 2
+Output is human-readable text by default:
   1 axis:  A,B,Index,Angle
   2 axes:  A1,B1,A2,B2,Index,Angle1,Angle2
+Pass --binary (as output_display.py does) for a stream of fixed-size records (see RECORD):
+  NumAxes, A1, B1, A2, B2, Index (uint8 each), Angle1, Angle2 (float32), little-endian
+  (A2/B2/Angle2 are 0 in single-axis mode)
+Samples are generated a batch at a time with numpy (one batch per pipe write).
 Runs indefinitely until killed.
 """
+import os
 import time
-import math
 import sys
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numpy fill_batch is used as is
+    njit = None
+
 NUM_AXES = 1  # set to 1 or 2 for single or dual axis mode
+# NumAxes, A1, B1, A2, B2, Index, Angle1, Angle2 -- packed little-endian,
+# byte-for-byte the same as struct '<6B2f' (PACKET in output_display.py)
+RECORD = np.dtype([('num_axes', 'u1'), ('a1', 'u1'), ('b1', 'u1'), ('a2', 'u1'),
+                   ('b2', 'u1'), ('index', 'u1'), ('angle1', '<f4'), ('angle2', '<f4')])
+FLUSH_INTERVAL = 0.05  # s between pipe writes in binary mode (one batch each)
 CPR = 4096  # Cycles Per Revolution
 ANGLE_RESOLUTION = 360.0 / (4 * CPR)  # minimum angle step (0.0220 degrees)
+ANGLE_RESOLUTION_INV = 1.0 / ANGLE_RESOLUTION  # positions per degree
+# Gray code quadrature pattern, indexed by position % 4
+QUAD_A = np.array([0, 1, 1, 0], dtype=np.uint8)
+QUAD_B = np.array([0, 0, 1, 1], dtype=np.uint8)
 
 def quantize_angle_to_cpr(angle_deg):
-    """Quantize angle to the nearest CPR resolution step."""
-    return round(angle_deg / ANGLE_RESOLUTION) * ANGLE_RESOLUTION
+    """Quantize angles (array) to the nearest CPR resolution step."""
+    return np.rint(angle_deg * ANGLE_RESOLUTION_INV) * ANGLE_RESOLUTION
 
 def quadrature_pattern_from_angle(angle_deg):
-    """Map angle to quadrature state using Gray code pattern.
+    """Map angles (array) in [0, 360) to quadrature states (A, B) using Gray code pattern.
     With CPR=4096, this cycles through 4 states per complete revolution.
     """
-    # Map angle [0,360) to position within one cycle [0,4*CPR)
-    position = int((angle_deg % 360.0) / 360.0 * (4 * CPR)) % (4 * CPR)
-    # Map position to quadrature state (0-3)
-    state = position % 4
-    # Gray code quadrature pattern: (A, B)
-    patterns = [(0, 0), (1, 0), (1, 1), (0, 1)]
-    return patterns[state]
+    # position within one revolution is [0, 4*CPR); only its low 2 bits
+    # select the state, so the wrap to 4*CPR can be skipped
+    state = (angle_deg * ANGLE_RESOLUTION_INV).astype(np.int64) & 3
+    return QUAD_A[state], QUAD_B[state]
+
+def fill_batch(records, first_iteration, output_rate, num_axes):
+    """Fill the RECORD array with consecutive samples starting at first_iteration."""
+    t = (first_iteration + np.arange(len(records))) * output_rate
+
+    # simulated angles (deg) - sweeping motion to show all quadrature states
+    raw_angle1 = (t * 0.3) % 360.0  # steady rotation at 1 deg/sec
+    raw_angle2 = ((t * 10.0) + 90.0) % 360.0  # steady rotation at 10 deg/sec, offset 90 degrees
+
+    # Quantize to CPR resolution and wrap to [0, 360)
+    angle1 = quantize_angle_to_cpr(raw_angle1) % 360.0
+    angle2 = quantize_angle_to_cpr(raw_angle2) % 360.0
+
+    records['num_axes'] = num_axes
+    records['a1'], records['b1'] = quadrature_pattern_from_angle(angle1)
+    records['index'] = (np.abs(angle1) < 0.01) | (np.abs(angle1 - 360.0) < 0.01)
+    records['angle1'] = angle1
+
+    if num_axes == 1:
+        records['a2'] = records['b2'] = 0
+        records['angle2'] = 0.0
+    else:
+        records['a2'], records['b2'] = quadrature_pattern_from_angle(angle2)
+        records['angle2'] = angle2
+
+if njit is not None:
+    @njit(cache=True)
+    def _fill_batch_loop(records, first_iteration, output_rate, num_axes):
+        """Compiled per-record equivalent of the numpy fill_batch above."""
+        for i in range(records.shape[0]):
+            t = (first_iteration + i) * output_rate
+            raw_angle1 = (t * 0.3) % 360.0
+            raw_angle2 = ((t * 10.0) + 90.0) % 360.0
+            angle1 = (np.rint(raw_angle1 * ANGLE_RESOLUTION_INV) * ANGLE_RESOLUTION) % 360.0
+            angle2 = (np.rint(raw_angle2 * ANGLE_RESOLUTION_INV) * ANGLE_RESOLUTION) % 360.0
+
+            rec = records[i]
+            rec['num_axes'] = num_axes
+            state = int(angle1 * ANGLE_RESOLUTION_INV) & 3
+            rec['a1'] = QUAD_A[state]
+            rec['b1'] = QUAD_B[state]
+            rec['index'] = 1 if (abs(angle1) < 0.01 or abs(angle1 - 360.0) < 0.01) else 0
+            rec['angle1'] = angle1
+
+            if num_axes == 1:
+                rec['a2'] = 0
+                rec['b2'] = 0
+                rec['angle2'] = 0.0
+            else:
+                state = int(angle2 * ANGLE_RESOLUTION_INV) & 3
+                rec['a2'] = QUAD_A[state]
+                rec['b2'] = QUAD_B[state]
+                rec['angle2'] = angle2
+
+    fill_batch = _fill_batch_loop
+
+def format_csv(rec):
+    if NUM_AXES == 1:
+        # single axis: A,B,Index,Angle
+        return f"{rec['a1']},{rec['b1']},{rec['index']},{rec['angle1']:.4f}\n"
+    # dual axis: A1,B1,A2,B2,Index,Angle1,Angle2
+    return (f"{rec['a1']},{rec['b1']},{rec['a2']},{rec['b2']},{rec['index']},"
+            f"{rec['angle1']:.4f},{rec['angle2']:.4f}\n")
+
+def write_all(fd, data):
+    """os.write() until every byte of data has gone out."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def sleep_until(deadline):
+    # sleep to an absolute deadline so the rate doesn't drift with the
+    # time spent generating/writing samples
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
 
 def main():
     output_rate = 0.01  # 100 Hz output (for display responsiveness)
+    binary_mode = '--binary' in sys.argv[1:]
+    batch = max(1, round(FLUSH_INTERVAL / output_rate))  # samples per batch
+    records = np.zeros(batch, dtype=RECORD)
+    out_fd = sys.stdout.fileno()
     iteration = 0
+    next_t = time.monotonic()
     try:
         while True:
-            # Calculate time based on iteration count and output rate
-            t = iteration * output_rate
-            
-            # simulated angles (deg) - sweeping motion to show all quadrature states
-            raw_angle1 = (t * 0.3) % 360.0  # steady rotation at 1 deg/sec
-            raw_angle2 = ((t * 10.0) + 90.0) % 360.0  # steady rotation at 10 deg/sec, offset 90 degrees
-            
-            # Quantize to CPR resolution and wrap to [0, 360)
-            angle1 = quantize_angle_to_cpr(raw_angle1) % 360.0
-            angle2 = quantize_angle_to_cpr(raw_angle2) % 360.0
-
-            a1, b1 = quadrature_pattern_from_angle(angle1)
-            index = 1 if (abs(angle1) < 0.01 or abs(angle1 - 360.0) < 0.01) else 0
-
-            if NUM_AXES == 1:
-                # single axis: A,B,Index,Angle
-                line = f"{a1},{b1},{index},{angle1:.4f}\n"
+            fill_batch(records, iteration, output_rate, NUM_AXES)
+            iteration += batch
+            if binary_mode:
+                # write the batch once its last sample is due
+                next_t += batch * output_rate
+                sleep_until(next_t - output_rate)
+                write_all(out_fd, records)
             else:
-                # dual axis: A1,B1,A2,B2,Index,Angle1,Angle2
-                a2, b2 = quadrature_pattern_from_angle(angle2)
-                line = f"{a1},{b1},{a2},{b2},{index},{angle1:.4f},{angle2:.4f}\n"
-
-            sys.stdout.write(line)
-            sys.stdout.flush()
-            time.sleep(output_rate)  # synchronized with angle update rate
-            iteration += 1
+                # one line per sample, each at its own time
+                for rec in records.tolist():
+                    rec = dict(zip(RECORD.names, rec))
+                    sys.stdout.write(format_csv(rec))
+                    sys.stdout.flush()
+                    next_t += output_rate
+                    sleep_until(next_t)
     except KeyboardInterrupt:
         pass
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,110 @@
+"""Headless tests for output_display.py sample handling.
+
+The display is built without a Tk root (LiveDisplay.__new__) on a
+minimal stand-in canvas, so these run without a display server:
+  python -m unittest test_output_display
+"""
+import unittest
+from collections import deque
+
+import numpy as np
+
+import output_display as od
+
+
+class _FakeCanvas:
+    """Just enough of tk.Canvas for _build_items/_draw_frame."""
+
+    _w = '.canvas'
+
+    def __init__(self):
+        self.coords = {}
+        self._next_id = 0
+        canvas = self
+
+        class _Tk:
+            def call(self, path, cmd, item, *xy):
+                canvas.coords[item] = list(xy)
+
+        self.tk = _Tk()
+
+    def _create(self, *args, **kwargs):
+        self._next_id += 1
+        return self._next_id
+
+    create_text = create_line = create_oval = _create
+
+    def delete(self, tag):
+        self.coords.clear()
+
+    def itemconfig(self, item, **kwargs):
+        pass
+
+
+class _FakeLabel:
+    def config(self, **kwargs):
+        self.text = kwargs.get('text')
+
+
+def _make_display(num_axes=1):
+    d = od.LiveDisplay.__new__(od.LiveDisplay)
+    d.canvas = _FakeCanvas()
+    d.canvas_w, d.canvas_h = 1000, 500
+    d.angle1_label, d.angle2_label = _FakeLabel(), _FakeLabel()
+    d._ring = np.zeros((2, 2 * od.SAMPLES), dtype=np.uint8)
+    d._write_idx = 0
+    d.num_axes = num_axes
+    d.index = 0
+    d.angle1 = d.angle2 = None
+    d._label_text = [None, None]
+    d._layout = None
+    d._dirty = True
+    d._last_frame = 0.0
+    d._inq = deque()
+    d.running = True
+    d.scheduled = []
+    d.after = lambda ms, fn: d.scheduled.append(fn)
+    return d
+
+
+def _levels(d, row):
+    """Level (True = high) of each sample drawn on waveform row `row`."""
+    xy = d.canvas.coords[d._row_lines[row]]
+    pts = list(zip(xy[0::2], xy[1::2]))
+    y_high = d._y_high[row, 0]
+    levels = []
+    for x_left, x_right in zip(d._xs[:-1], d._xs[1:]):
+        mid = (x_left + x_right) / 2
+        for (xa, ya), (xb, yb) in zip(pts, pts[1:]):
+            if ya == yb and xa <= mid <= xb:
+                levels.append(ya == y_high)
+                break
+    return levels
+
+
+class ApplyRecordsTest(unittest.TestCase):
+
+    def test_malformed_csv_line_does_not_stop_redraw(self):
+        d = _make_display()
+        sample = od.parse_csv_line('-1,0,1,45.0')
+        self.assertIsNotNone(sample)
+        d._inq.append(sample)
+
+        d.redraw()
+
+        # negative level counts as high, and the redraw loop is rescheduled
+        self.assertEqual(d._ring[0, d._write_idx - 1], 0b10)
+        self.assertEqual(d.scheduled, [d.redraw])
+
+    def test_truthy_levels_draw_high_on_their_own_row(self):
+        d = _make_display(num_axes=2)
+        d._apply_records([od.parse_csv_line('2,0,0,1,0,10.0,20.0')])
+        d.redraw()
+
+        # newest sample is rightmost: A1 and B2 high, B1 and A2 low
+        newest = [_levels(d, row)[-1] for row in range(4)]
+        self.assertEqual(newest, [True, False, False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()